@@ -8,7 +8,10 @@ T = TypeVar("T", bound=BaseModel)
 class BaseToolInput(BaseModel):
     """Base class for tool input models."""
 
-    model_config = {"extra": "forbid"}
+    # Core schemas are built on first use rather than at import, so tools
+    # that are never called don't pay for their models. Instances are
+    # single-use value objects and are never mutated after construction.
+    model_config = {"extra": "forbid", "defer_build": True, "frozen": True}
 
 
 class ToolContent(BaseModel):
@@ -40,11 +43,22 @@ class ToolResponse(BaseModel):
 
     @classmethod
     def from_model(cls, model: BaseModel) -> "ToolResponse":
-        return cls(
-            content=[
-                ToolContent(type="json", json_data=model.model_dump(), model=model)
-            ]
+        # The model was validated when it was built and model_dump() output
+        # is already well-formed, so wrap it without validating it again.
+        content = ToolContent.model_construct(
+            type="json", json_data=model.model_dump(), model=model
         )
+        return cls.model_construct(content=[content])
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "ToolResponse":
+        """Wrap an already JSON-shaped payload as a single JSON content.
+
+        For fixed-shape responses built entirely from server-side values;
+        the payload must carry every field of the tool's output_model.
+        """
+        content = ToolContent.model_construct(type="json", json_data=payload)
+        return cls.model_construct(content=[content])
 
     @classmethod
     def from_text(cls, text: str) -> "ToolResponse":
@@ -59,16 +73,29 @@ class Tool(ABC):
     input_model: ClassVar[Type[BaseToolInput]]
     output_model: ClassVar[Optional[Type[BaseModel]]] = None
 
+    # Filled on first get_schema() call; only depends on class attributes.
+    # Built lazily rather than here so deferred model builds stay deferred.
+    SCHEMA: ClassVar[Optional[Dict[str, Any]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each tool class gets its own slot instead of inheriting a parent's
+        cls.SCHEMA = None
+
     @abstractmethod
     async def execute(self, input_data: BaseToolInput) -> ToolResponse:
         pass
 
     def get_schema(self) -> Dict[str, Any]:
-        schema = {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-        }
-        if self.output_model:
-            schema["output"] = self.output_model.model_json_schema()
+        schema = self.SCHEMA
+        if schema is None:
+            cls = type(self)
+            schema = {
+                "name": cls.name,
+                "description": cls.description,
+                "input": cls.input_model.model_json_schema(),
+            }
+            if cls.output_model:
+                schema["output"] = cls.output_model.model_json_schema()
+            cls.SCHEMA = schema
         return schema
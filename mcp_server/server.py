@@ -18,6 +18,7 @@ from mcp_server.tools import (
     SubmitMappings,
     GetListenerStatus,
     SendIRCommand,
+    SendIRCommandBatch,
     TroubleshootIR,
     # Sensor tools
     ReadHumiditySensor,
@@ -48,6 +49,7 @@ def get_available_tools() -> List[Tool]:
         SubmitMappings(),
         GetListenerStatus(),
         SendIRCommand(),
+        SendIRCommandBatch(),
         TroubleshootIR(),
         # Sensor tools
         ReadHumiditySensor(),
@@ -1,69 +1,202 @@
 import logging
 import time
 import threading
+from array import array
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, Dict, List, Tuple
 
-try:
-    import pigpio
+logger = logging.getLogger(__name__)
 
-    PIGPIO_AVAILABLE = True
-except ImportError:
-    PIGPIO_AVAILABLE = False
-    pigpio = None
+_NOISE_ANALYSIS = {"protocol": "Noise", "code": "0x00000000"}
+
+# pigpio line levels; the receiver output is active-low, so a mark reads 0
+LEVEL_LOW = 0
+LEVEL_HIGH = 1
+
+# Events are appended in capture order, so t_mono_ns is non-decreasing along
+# the event deque and a time window can be located by bisection
+_event_time = attrgetter("t_mono_ns")
+
+
+@dataclass(slots=True)
+class IREvent:
+    """A captured IR signal with its decoded protocol and code."""
+
+    t_mono_ns: int
+    signal_number: int
+    durations: array
+    levels: bytearray
+    total_duration_us: int
+    pulse_count: int
+    protocol: str
+    code: str
+    address: Optional[int] = None
+    command: Optional[int] = None
+
+    def to_dict(self, timestamp: datetime) -> Dict:
+        """Expand the event into the dict layout used by the device registry."""
+        timing_data = list(zip(self.levels, self.durations))
+        analysis = {
+            "protocol": self.protocol,
+            "code": self.code,
+            "raw_timing_data": timing_data,
+        }
+        if self.address is not None:
+            analysis["address"] = self.address
+            analysis["command"] = self.command
 
-logger = logging.getLogger(__name__)
+        return {
+            "timestamp": timestamp,
+            "type": "ir_signal",
+            "signal_number": self.signal_number,
+            "timing_data": timing_data,
+            "total_duration_us": self.total_duration_us,
+            "pulse_count": self.pulse_count,
+            "analysis": analysis,
+        }
 
 
-class IRListenerManager:
-    """Simplified IR listener using pigpio for hardware-precise timing."""
+def _decode_nec_frame(durations: array) -> Optional[Tuple[int, int]]:
+    """Decode the (address, command) bytes of an NEC frame.
+
+    Works on plain integers only, so it can be called from any thread and
+    timed or exercised without a listener instance.
+    """
+    if len(durations) < 34:
+        return None
+
+    # Bits arrive LSB first; fold them straight into one integer
+    code = 0
+    bit_count = 0
+
+    # Skip AGC (first 2 pulses); data bits are (mark, space) pairs.
+    # Strided slices split the marks and spaces in C, and zip stops
+    # at the shorter one for truncated frames.
+    marks = durations[2:66:2]
+    spaces = durations[3:67:2]
+
+    for low_pulse, high_pulse in zip(marks, spaces):
+        if not (300 <= low_pulse <= 800 and 300 <= high_pulse <= 2200):
+            break
+
+        # ~560us space is a 0, ~1690us space is a 1
+        if high_pulse > 1000:
+            code |= 1 << bit_count
+        bit_count += 1
+
+    if bit_count < 16:
+        return None
 
-    _instance = None
-    _ir_events = []
-    _is_listening = False
-    _pi = None
-    _callback = None
+    return code & 0xFF, (code >> 8) & 0xFF
+
+
+class IRListenerManager:
+    """Simplified IR listener using pigpio for hardware-precise timing.
+
+    A single shared instance lives at module level; use get_instance().
+    """
+
+    __slots__ = (
+        "_ir_events",
+        "_is_listening",
+        "_pigpio",
+        "_pi",
+        "_callback",
+        "_durations",
+        "_levels",
+        "_head",
+        "_tail",
+        "_last_tick",
+        "_last_level",
+        "_last_signal_time",
+        "_signal_counter",
+        "_epoch_wall",
+        "_epoch_mono_ns",
+        "_watchdog",
+        "_watchdog_stop",
+    )
 
     # GPIO pin for IR receiver
     PIN = 27
 
     # Signal processing
-    _current_signal = []
-    _last_tick = None
-    _last_level = None
-    _last_signal_time = 0
     _signal_timeout_ms = 200
-    _signal_counter = 0
+    _max_signal_pulses = 1024
+    _glitch_filter_us = 50
+    _min_signal_pulses = 4
+    _min_signal_duration_us = 1000
 
-    # Thread safety
-    _signal_lock = None
-    _completion_timer = None
+    # How often the watchdog checks for a quiet line
+    _watchdog_interval_s = 0.05
 
     # Memory management
     _max_events = 1000
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._signal_lock = threading.Lock()
-        return cls._instance
+    def __init__(self):
+        self._ir_events = deque(maxlen=self._max_events)
+        self._is_listening = False
+        # pigpio module, imported on first use so servers that never listen
+        # for IR don't pay for it
+        self._pigpio = None
+        self._pi = None
+        self._callback = None
+        # Preallocated pulse ring shared by the GPIO callback (producer,
+        # sole writer of _head) and the watchdog (consumer, sole writer of
+        # _tail). Indices only grow; slots are addressed modulo the size.
+        self._durations = array("I", bytes(4 * self._max_signal_pulses))
+        self._levels = bytearray(self._max_signal_pulses)
+        self._head = 0
+        self._tail = 0
+        self._last_tick = None
+        self._last_level = None
+        self._last_signal_time = 0
+        self._signal_counter = 0
+        self._set_epoch()
+        self._watchdog = None
+        self._watchdog_stop = threading.Event()
+
+    def _set_epoch(self):
+        """Pair the wall clock with the monotonic clock for timestamp conversion."""
+        self._epoch_wall = time.time()
+        self._epoch_mono_ns = time.monotonic_ns()
+
+    def _event_datetime(self, t_mono_ns: int) -> datetime:
+        """Convert an event's monotonic stamp to local wall-clock time."""
+        return datetime.fromtimestamp(
+            self._epoch_wall + (t_mono_ns - self._epoch_mono_ns) / 1e9
+        )
+
+    def pigpio_available(self) -> bool:
+        """Import pigpio on first call and report whether it is installed."""
+        if self._pigpio is None:
+            try:
+                import pigpio
+            except ImportError:
+                return False
+            self._pigpio = pigpio
+        return True
 
     @classmethod
-    def get_instance(cls):
-        return cls()
+    def get_instance(cls) -> "IRListenerManager":
+        return _manager
 
     def is_listening(self) -> bool:
         return self._is_listening
 
     async def start_listening(self) -> Tuple[bool, str]:
         """Start the IR listener using pigpio callbacks."""
-        if not PIGPIO_AVAILABLE:
+        if not self.pigpio_available():
             return False, "pigpio not available - IR listening requires pigpio support"
 
         if self._is_listening:
             return True, "IR listener is already running."
 
         try:
+            pigpio = self._pigpio
             self._pi = pigpio.pi()
 
             if not self._pi.connected:
@@ -78,18 +211,19 @@ class IRListenerManager:
             self._pi.set_mode(self.PIN, pigpio.INPUT)
             self._pi.set_pull_up_down(self.PIN, pigpio.PUD_UP)
 
+            # Let pigpiod drop sub-threshold glitches in C so they never
+            # cross into the Python callback
+            self._pi.set_glitch_filter(self.PIN, self._glitch_filter_us)
+
             # Clear events and reset state
             self._ir_events.clear()
-            with self._signal_lock:
-                self._current_signal = []
-                self._last_tick = None
-                self._last_level = None
-                self._last_signal_time = 0
-                self._signal_counter = 0
-
-            if self._completion_timer:
-                self._completion_timer.cancel()
-                self._completion_timer = None
+            self._head = 0
+            self._tail = 0
+            self._last_tick = None
+            self._last_level = None
+            self._last_signal_time = 0
+            self._signal_counter = 0
+            self._set_epoch()
 
             # Set up callback for edge detection
             self._callback = self._pi.callback(
@@ -97,6 +231,7 @@ class IRListenerManager:
             )
 
             self._is_listening = True
+            self._start_watchdog()
             logger.info(f"IR listener started on GPIO{self.PIN}")
             return (
                 True,
@@ -117,24 +252,23 @@ class IRListenerManager:
 
         try:
             self._is_listening = False
-
-            if self._completion_timer:
-                self._completion_timer.cancel()
-                self._completion_timer = None
+            self._stop_watchdog()
 
             if self._callback:
                 self._callback.cancel()
                 self._callback = None
 
             if self._pi and self._pi.connected:
+                # The filter lives in pigpiod and would outlast this client
+                self._pi.set_glitch_filter(self.PIN, 0)
                 self._pi.stop()
                 self._pi = None
 
-            with self._signal_lock:
-                self._current_signal = []
-                self._last_tick = None
-                self._last_level = None
-                self._last_signal_time = 0
+            self._head = 0
+            self._tail = 0
+            self._last_tick = None
+            self._last_level = None
+            self._last_signal_time = 0
 
             events_count = len(self._ir_events)
             logger.info(f"IR listener stopped. Captured {events_count} events")
@@ -148,218 +282,236 @@ class IRListenerManager:
             return False, f"Failed to stop IR listener: {e}"
 
     def _gpio_callback(self, _gpio, level, tick):
-        """Handle GPIO state changes with hardware-precise timing."""
+        """Handle GPIO state changes with hardware-precise timing.
+
+        Runs on the pigpio callback thread, which is the only writer of the
+        edge state and of the ring head, so no lock is taken per edge.
+        """
         try:
-            with self._signal_lock:
-                current_time = time.time()
+            # Calculate pulse duration if we have a previous tick
+            if self._last_tick is not None:
+                duration_us = self._tick_diff(self._last_tick, tick)
 
-                # Calculate pulse duration if we have a previous tick
-                if self._last_tick is not None:
-                    duration_us = self._tick_diff(self._last_tick, tick)
+                # Filter noise - ignore very short pulses
+                if duration_us < self._glitch_filter_us:
+                    return
 
-                    # Filter noise - ignore very short pulses
-                    if duration_us < 50:
-                        return
+                # A gap longer than the timeout is the idle line before a
+                # new signal, not part of it
+                if duration_us >= self._signal_timeout_ms * 1000:
+                    self._last_tick = tick
+                    self._last_level = level
+                    return
 
-                    # Add pulse to current signal
-                    self._current_signal.append((self._last_level, duration_us))
-                    self._last_signal_time = current_time
+                # The signal time is refreshed before the head is published,
+                # so the watchdog never sees a new pulse with a stale time
+                # and finishes the signal early
+                self._last_signal_time = time.monotonic()
 
-                # Update state
-                self._last_tick = tick
-                self._last_level = level
+                # Add pulse to current signal; pulses past the buffer are
+                # dropped. The slot is filled before the head is published.
+                head = self._head
+                if head - self._tail < self._max_signal_pulses:
+                    slot = head % self._max_signal_pulses
+                    self._durations[slot] = duration_us
+                    self._levels[slot] = self._last_level
+                    self._head = head + 1
 
-                # Cancel any existing completion timer
-                if self._completion_timer:
-                    self._completion_timer.cancel()
-
-                # Start new completion timer
-                self._completion_timer = threading.Timer(
-                    self._signal_timeout_ms / 1000.0, self._complete_signal_sync
-                )
-                self._completion_timer.start()
+            # Update state
+            self._last_tick = tick
+            self._last_level = level
 
         except Exception as e:
-            logger.error(f"Error in GPIO callback: {e}")
-            with self._signal_lock:
-                self._current_signal = []
-                self._last_tick = None
-                self._last_level = None
+            logger.error("Error in GPIO callback: %s", e)
+            self._last_tick = None
+            self._last_level = None
+
+    def _start_watchdog(self):
+        """Start the thread that finishes signals after the line goes quiet."""
+        self._watchdog_stop.clear()
+        self._watchdog = threading.Thread(
+            target=self._watchdog_loop, name="ir-signal-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def _stop_watchdog(self):
+        """Stop the signal watchdog thread."""
+        self._watchdog_stop.set()
+        if self._watchdog:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    def _watchdog_loop(self):
+        """Poll for completed signals until the listener stops."""
+        while not self._watchdog_stop.wait(self._watchdog_interval_s):
+            self._complete_signal_sync()
 
     def _complete_signal_sync(self):
-        """Complete signal processing - called from timer thread."""
+        """Complete signal processing - called from the watchdog thread."""
         try:
-            with self._signal_lock:
-                if not self._current_signal or not self._is_listening:
-                    return
+            if self._head == self._tail or not self._is_listening:
+                return
 
-                current_time = time.time()
-                time_since_last = (current_time - self._last_signal_time) * 1000
+            time_since_last = (time.monotonic() - self._last_signal_time) * 1000
 
-                if time_since_last >= self._signal_timeout_ms:
-                    self._finish_current_signal()
+            if time_since_last >= self._signal_timeout_ms:
+                self._finish_current_signal()
 
         except Exception as e:
-            logger.error(f"Error completing signal: {e}")
+            logger.error("Error completing signal: %s", e)
 
     def _finish_current_signal(self):
         """Process and store the completed signal."""
-        if not self._current_signal:
+        head = self._head
+        tail = self._tail
+        pulse_count = head - tail
+        if not pulse_count:
             return
 
+        # Copy the pending slots out, then advance the tail to hand them
+        # back to the callback for the next signal.
+        size = self._max_signal_pulses
+        start = tail % size
+        stop = start + pulse_count
+        if stop <= size:
+            durations = self._durations[start:stop]
+            levels = self._levels[start:stop]
+        else:
+            durations = self._durations[start:] + self._durations[: stop - size]
+            levels = self._levels[start:] + self._levels[: stop - size]
+        self._tail = head
         self._signal_counter += 1
         signal_number = self._signal_counter
-        timing_data = self._current_signal.copy()
 
         try:
-            # Analyze the signal
-            analysis = self._analyze_signal(timing_data, signal_number)
-            total_duration = sum(duration for _, duration in timing_data)
+            total_duration = sum(durations)
+
+            # Too short to be a remote button; don't bother decoding
+            if (
+                pulse_count < self._min_signal_pulses
+                or total_duration < self._min_signal_duration_us
+            ):
+                analysis = _NOISE_ANALYSIS
+            else:
+                analysis = self._analyze_signal(durations, levels, signal_number)
 
             # Create event
-            ir_event = {
-                "timestamp": datetime.now(),
-                "type": "ir_signal",
-                "signal_number": signal_number,
-                "timing_data": timing_data,
-                "total_duration_us": total_duration,
-                "pulse_count": len(timing_data),
-                "analysis": analysis,
-            }
+            ir_event = IREvent(
+                t_mono_ns=time.monotonic_ns(),
+                signal_number=signal_number,
+                durations=durations,
+                levels=levels,
+                total_duration_us=total_duration,
+                pulse_count=pulse_count,
+                protocol=analysis["protocol"],
+                code=analysis["code"],
+                address=analysis.get("address"),
+                command=analysis.get("command"),
+            )
 
+            # Oldest events fall off once _max_events is reached
             self._ir_events.append(ir_event)
 
-            # Memory management - trim oldest events if needed
-            if len(self._ir_events) > self._max_events:
-                remove_count = self._max_events // 10
-                self._ir_events = self._ir_events[remove_count:]
-
-            logger.info(
-                f"Signal {signal_number}: {len(timing_data)} pulses, {total_duration}μs"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Signal %d: %d pulses, %d us",
+                    signal_number,
+                    pulse_count,
+                    total_duration,
+                )
 
         except Exception as e:
-            logger.error(f"Signal processing failed: {e}")
-
-        # Clear current signal
-        self._current_signal = []
+            logger.error("Signal processing failed: %s", e)
 
     def _tick_diff(self, tick1: int, tick2: int) -> int:
-        """Calculate difference between pigpio ticks (handles wraparound)."""
-        if pigpio:
-            try:
-                return pigpio.tickDiff(tick1, tick2)
-            except Exception:
-                pass
+        """Calculate difference between pigpio ticks (handles wraparound).
 
-        # Fallback for tick wraparound (32-bit microsecond counter)
-        diff = tick2 - tick1
-        if diff < -2147483648:
-            diff += 4294967296
-        elif diff > 2147483647:
-            diff -= 4294967296
-        return abs(diff)
+        Ticks are an unsigned 32-bit microsecond counter, so masking the
+        subtraction gives the elapsed time across a wrap, like pigpio.tickDiff.
+        """
+        return (tick2 - tick1) & 0xFFFFFFFF
 
     def _analyze_signal(
-        self, timing_data: List[Tuple[str, int]], signal_number: int
+        self,
+        durations: array,
+        levels: bytearray,
+        signal_number: int,
     ) -> Dict:
-        """Analyze IR signal and generate unique code."""
-        if not timing_data:
-            return {"protocol": "Empty", "code": "0x00000000", "raw_timing_data": []}
-
-        total_duration = sum(duration for _, duration in timing_data)
-
-        # Basic validation
-        if total_duration < 1000:
-            return {
-                "protocol": "Noise",
-                "code": "0x00000000",
-                "raw_timing_data": timing_data,
-            }
+        """Analyze IR signal and generate unique code.
 
+        Expects a signal that already passed the noise gate in
+        _finish_current_signal (at least _min_signal_pulses pulses).
+        """
         # Try NEC protocol detection
-        if len(timing_data) >= 4:
-            first_low = timing_data[0][1] if timing_data[0][0] == "low" else 0
-            first_high = (
-                timing_data[1][1]
-                if len(timing_data) > 1 and timing_data[1][0] == "high"
-                else 0
-            )
-
-            # NEC AGC pattern: 9ms low, 4.5ms high
-            if 7000 <= first_low <= 12000 and 3000 <= first_high <= 6000:
-                nec_result = self._decode_nec(timing_data)
-                if nec_result:
-                    return nec_result
+        # NEC AGC pattern: 9ms low, 4.5ms high
+        if (
+            levels[0] == LEVEL_LOW
+            and 7000 <= durations[0] <= 12000
+            and levels[1] == LEVEL_HIGH
+            and 3000 <= durations[1] <= 6000
+        ):
+            nec_result = self._decode_nec(durations)
+            if nec_result:
+                return nec_result
 
         # Generic protocol: use simple unique code based on signal number
-        return {
-            "protocol": "Generic",
-            "code": f"0xSIG{signal_number:04X}",
-            "pulse_count": len(timing_data),
-            "total_duration_us": total_duration,
-            "raw_timing_data": timing_data,
-        }
+        return {"protocol": "Generic", "code": f"0xSIG{signal_number:04X}"}
 
-    def _decode_nec(self, timing_data: List[Tuple[str, int]]) -> Optional[Dict]:
+    def _decode_nec(self, durations: array) -> Optional[Dict]:
         """Decode NEC protocol IR signal."""
-        if len(timing_data) < 34:
-            return None
-
         try:
-            data_bits = []
-
-            # Skip AGC (first 2 pulses), decode data bits
-            for i in range(2, min(66, len(timing_data) - 1), 2):
-                if i + 1 >= len(timing_data):
-                    break
-
-                low_pulse = timing_data[i][1]
-                high_pulse = timing_data[i + 1][1]
-
-                if 300 <= low_pulse <= 800:
-                    if 300 <= high_pulse <= 800:
-                        data_bits.append(0)
-                    elif 1200 <= high_pulse <= 2200:
-                        data_bits.append(1)
-                    else:
-                        break
-                else:
-                    break
-
-            if len(data_bits) >= 16:
-                address = sum(data_bits[i] << i for i in range(8) if i < len(data_bits))
-                command = sum(
-                    data_bits[i + 8] << i for i in range(8) if (i + 8) < len(data_bits)
-                )
+            decoded = _decode_nec_frame(durations)
+        except Exception as e:
+            logger.debug("NEC decode failed: %s", e)
+            return None
 
-                return {
-                    "protocol": "NEC",
-                    "address": address,
-                    "command": command,
-                    "code": f"0x{address:02X}{command:02X}",
-                    "raw_timing_data": timing_data,
-                }
+        if decoded is None:
+            return None
 
-        except Exception as e:
-            logger.debug(f"NEC decode failed: {e}")
+        address, command = decoded
+        return {
+            "protocol": "NEC",
+            "address": address,
+            "command": command,
+            "code": f"0x{address:02X}{command:02X}",
+        }
 
-        return None
+    def _window_start(self, cutoff_ns: int) -> int:
+        """Index of the first stored event newer than cutoff_ns."""
+        return bisect_right(self._ir_events, cutoff_ns, key=_event_time)
 
     def get_recent_events(self, horizon_s: int = 20) -> List[Dict]:
         """Get IR events from the last horizon_s seconds."""
-        cutoff_time = datetime.now().timestamp() - horizon_s
+        events = self._ir_events
+        start = self._window_start(time.monotonic_ns() - horizon_s * 1_000_000_000)
+        recent = [events[i] for i in range(start, len(events))]
         return [
-            event
-            for event in self._ir_events
-            if event["timestamp"].timestamp() > cutoff_time
+            event.to_dict(self._event_datetime(event.t_mono_ns)) for event in recent
         ]
 
+    def count_recent_events(self, horizon_s: int = 20) -> int:
+        """Count IR events from the last horizon_s seconds without copying them."""
+        return self.count_recent_events_multi((horizon_s,))[0]
+
+    def count_recent_events_multi(self, horizons_s: Tuple[int, ...]) -> Tuple[int, ...]:
+        """Count events within each horizon, one bisection per horizon.
+
+        Events are never copied; each window takes about log2(N) indexed
+        reads of the deque instead of a walk over every stored event.
+        Deque indexing itself is not O(1) (it steps through 64-slot blocks),
+        but the event buffer is bounded, so this stays cheap.
+        """
+        now_ns = time.monotonic_ns()
+        total = len(self._ir_events)
+        return tuple(
+            total - self._window_start(now_ns - horizon * 1_000_000_000)
+            for horizon in horizons_s
+        )
+
     def clear_events(self):
         """Clear all recorded IR events."""
         self._ir_events.clear()
-        with self._signal_lock:
-            self._signal_counter = 0
+        self._signal_counter = 0
 
     def get_listener_status(self) -> Dict:
         """Get status information."""
@@ -367,10 +519,11 @@ class IRListenerManager:
             "is_listening": self._is_listening,
             "gpio_pin": self.PIN,
             "total_events": len(self._ir_events),
-            "pigpio_available": PIGPIO_AVAILABLE,
+            "pigpio_available": self.pigpio_available(),
             "pigpio_connected": self._pi.connected if self._pi else False,
+            "listener_task_active": self._callback is not None,
             "signal_counter": self._signal_counter,
-            "current_signal_pulses": len(self._current_signal),
+            "current_signal_pulses": self._head - self._tail,
         }
 
         if self._pi and self._pi.connected:
@@ -379,9 +532,20 @@ class IRListenerManager:
             except Exception:
                 pass
 
+        status["recent_events_1min"] = 0
+        status["recent_events_5min"] = 0
         if self._ir_events:
+            recent_1min, recent_5min = self.count_recent_events_multi((60, 300))
+            status["recent_events_1min"] = recent_1min
+            status["recent_events_5min"] = recent_5min
+
             latest = self._ir_events[-1]
-            status["latest_event_time"] = latest["timestamp"].isoformat()
-            status["latest_event_code"] = latest.get("analysis", {}).get("code", "N/A")
+            status["latest_event_time"] = self._event_datetime(
+                latest.t_mono_ns
+            ).isoformat()
+            status["latest_event_code"] = latest.code
 
         return status
+
+
+_manager = IRListenerManager()
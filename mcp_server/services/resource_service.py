@@ -1,4 +1,5 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Pattern
+import inspect
 import re
 from fastmcp import FastMCP
 from mcp_server.interfaces.resource import Resource, ResourceResponse
@@ -10,6 +11,15 @@ class ResourceService:
     def __init__(self):
         self._resources: Dict[str, Resource] = {}
         self._uri_patterns: Dict[str, Resource] = {}
+        self._compiled_patterns: Dict[str, Pattern] = {}
+        self._dispatch_regex: Optional[Pattern] = None
+        self._dispatch_table: List[str] = []
+
+    @staticmethod
+    def _compile_uri_pattern(pattern: str) -> Pattern:
+        """Compile a URI template like 'foo://{id}' into an anchored regex."""
+        regex_pattern = re.sub(r"\{([^}]+)\}", r"(?P<\1>[^/]+)", pattern)
+        return re.compile(f"^{regex_pattern}$")
 
     def register_resource(self, resource: Resource) -> None:
         """Register a new resource."""
@@ -17,6 +27,26 @@ class ResourceService:
 
         if "{" not in resource.uri:
             self._resources[resource.uri] = resource
+        else:
+            self._compiled_patterns[resource.uri] = self._compile_uri_pattern(
+                resource.uri
+            )
+            self._dispatch_regex = None
+
+    def _build_dispatch_regex(self) -> Pattern:
+        """Combine all URI templates into one alternation regex.
+
+        Each template becomes a named branch `_r<index>`, so a single match
+        identifies the resource via `match.lastgroup`. Template parameters are
+        left unnamed because group names must be unique across branches.
+        """
+        self._dispatch_table = list(self._compiled_patterns)
+        branches = []
+        for index, pattern in enumerate(self._dispatch_table):
+            body = re.sub(r"\{([^}]+)\}", "[^/]+", pattern)
+            branches.append(f"(?P<_r{index}>{body})")
+        self._dispatch_regex = re.compile(f"^(?:{'|'.join(branches)})$")
+        return self._dispatch_regex
 
     def register_resources(self, resources: List[Resource]) -> None:
         """Register multiple resources."""
@@ -34,12 +64,12 @@ class ResourceService:
         if uri in self._resources:
             return self._resources[uri]
 
-        for pattern, resource in self._uri_patterns.items():
-            regex_pattern = re.sub(r"\{([^}]+)\}", r"(?P<\1>[^/]+)", pattern)
-            regex_pattern = f"^{regex_pattern}$"
-
-            match = re.match(regex_pattern, uri)
+        if self._compiled_patterns:
+            dispatch_regex = self._dispatch_regex or self._build_dispatch_regex()
+            match = dispatch_regex.match(uri)
             if match:
+                pattern = self._dispatch_table[int(match.lastgroup[2:])]
+                resource = self._uri_patterns[pattern]
                 self._resources[uri] = resource
                 return resource
 
@@ -47,17 +77,18 @@ class ResourceService:
 
     def extract_params_from_uri(self, pattern: str, uri: str) -> Dict[str, str]:
         """Extract parameters from a URI based on a pattern."""
-        regex_pattern = re.sub(r"\{([^}]+)\}", r"(?P<\1>[^/]+)", pattern)
-        regex_pattern = f"^{regex_pattern}$"
+        compiled = self._compiled_patterns.get(pattern)
+        if compiled is None:
+            compiled = self._compile_uri_pattern(pattern)
 
-        match = re.match(regex_pattern, uri)
+        match = compiled.match(uri)
         if match:
             return match.groupdict()
         return {}
 
     def create_handler(self, resource: Resource, uri_pattern: str):
         """Create a handler function for a resource with the correct parameters."""
-        uri_params = set(re.findall(r"\{([^}]+)\}", uri_pattern))
+        uri_params = list(dict.fromkeys(re.findall(r"\{([^}]+)\}", uri_pattern)))
 
         if not uri_params:
 
@@ -69,17 +100,28 @@ class ResourceService:
             static_handler.__doc__ = resource.description
             return static_handler
         else:
-            params_str = ", ".join(uri_params)
-            func_def = f"async def param_handler({params_str}) -> ResourceResponse:\n"
-            func_def += f'    """{resource.description}"""\n'
-            func_def += f"    return await resource.read({params_str})"
-
-            namespace = {"resource": resource, "ResourceResponse": ResourceResponse}
-            exec(func_def, namespace)
 
-            handler = namespace["param_handler"]
-            handler.__name__ = resource.name
-            return handler
+            async def param_handler(**params: str) -> ResourceResponse:
+                return await resource.read(**params)
+
+            # Advertise the URI parameters as the handler's own arguments so
+            # FastMCP can introspect them without generating code.
+            param_handler.__signature__ = inspect.Signature(
+                [
+                    inspect.Parameter(
+                        name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str
+                    )
+                    for name in uri_params
+                ],
+                return_annotation=ResourceResponse,
+            )
+            param_handler.__annotations__ = {
+                **{name: str for name in uri_params},
+                "return": ResourceResponse,
+            }
+            param_handler.__name__ = resource.name
+            param_handler.__doc__ = resource.description
+            return param_handler
 
     def register_mcp_handlers(self, mcp: FastMCP) -> None:
         """Register all resources as MCP handlers."""
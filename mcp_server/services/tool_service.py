@@ -1,4 +1,5 @@
-from typing import Dict, List, Any
+from typing import Awaitable, Callable, Dict, List, Any
+from pydantic import BaseModel
 from fastmcp import FastMCP
 from mcp_server.interfaces.tool import Tool, ToolResponse, ToolContent
 
@@ -8,10 +9,14 @@ class ToolService:
 
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
+        self._executors: Dict[str, Callable[[BaseModel], Awaitable[ToolResponse]]] = {}
+        self._serializers: Dict[str, Callable[[ToolResponse], Any]] = {}
 
     def register_tool(self, tool: Tool) -> None:
         """Register a new tool."""
         self._tools[tool.name] = tool
+        self._executors[tool.name] = tool.execute
+        self._serializers[tool.name] = self._select_serializer(tool)
 
     def register_tools(self, tools: List[Tool]) -> None:
         """Register multiple tools."""
@@ -32,6 +37,15 @@ class ToolService:
         input_model = tool.input_model.model_validate(input_data)
         return await tool.execute(input_model)
 
+    async def execute_tool_model(
+        self, tool_name: str, input_model: BaseModel
+    ) -> ToolResponse:
+        """Execute a tool by name with an already validated input model."""
+        execute = self._executors.get(tool_name)
+        if execute is None:
+            raise ValueError(f"Tool not found: {tool_name}")
+        return await execute(input_model)
+
     def _process_tool_content(self, content: ToolContent) -> Any:
         """Process a ToolContent object based on its type."""
         if content.type == "text":
@@ -51,19 +65,40 @@ class ToolService:
 
         return [self._process_tool_content(content) for content in response.content]
 
+    def _serialize_json_response(self, response: ToolResponse) -> Any:
+        """Serialize a response built by ToolResponse.from_model."""
+        content = response.content
+        if len(content) == 1 and content[0].json_data is not None:
+            return content[0].json_data
+        return self._serialize_response(response)
+
+    def _select_serializer(self, tool: Tool) -> Callable[[ToolResponse], Any]:
+        """Pick the response serializer for a tool once, at registration."""
+        if tool.output_model is not None:
+            # Tools with an output model answer with a single JSON content.
+            return self._serialize_json_response
+        return self._serialize_response
+
     def register_mcp_handlers(self, mcp: FastMCP) -> None:
         """Register all tools as MCP handlers."""
         for tool in self._tools.values():
 
             def create_handler(tool_instance):
+                serialize = self._serializers[tool_instance.name]
+
                 async def handler(input_data: tool_instance.input_model):
                     f'"""{tool_instance.description}"""'
-                    result = await self.execute_tool(
-                        tool_instance.name, input_data.model_dump()
+                    # FastMCP has already validated input_data against
+                    # input_model, so hand the model straight to the tool.
+                    result = await self.execute_tool_model(
+                        tool_instance.name, input_data
                     )
-                    return self._serialize_response(result)
+                    return serialize(result)
 
                 return handler
 
+            # Model builds are deferred at import; do them here, once, at
+            # server start so the first tools/list or call doesn't pay for it
+            tool.get_schema()
             handler = create_handler(tool)
             mcp.tool(name=tool.name, description=tool.description)(handler)
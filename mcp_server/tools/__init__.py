@@ -1,29 +1,34 @@
-from .infrared_retrieval import (
-    SendIRCommand,
-    StartIRListener,
-    StopIRListener,
-    ClearIREvents,
-    SubmitMappings,
-    GetListenerStatus,
-    TroubleshootIR,
-)
-from .humidity_sensor import ReadHumiditySensor
-from .photo_sensor import ReadPhotoSensor
-from .notifications import SendNotification
-from .simulation import ClimateSimulation
-from .smart_plug import ControlPlug
+from importlib import import_module
 
-__all__ = [
-    "SendIRCommand",
-    "StartIRListener",
-    "StopIRListener",
-    "ClearIREvents",
-    "SubmitMappings",
-    "GetListenerStatus",
-    "TroubleshootIR",
-    "ReadHumiditySensor",
-    "ReadPhotoSensor",
-    "SendNotification",
-    "ClimateSimulation",
-    "ControlPlug",
-]
+# Tool class -> subpackage that exports it. Subpackages are imported on
+# first attribute access, so importing one tool (or mcp_server.tools.X
+# directly) doesn't load every sensor and IR module.
+_TOOLS = {
+    "SendIRCommand": ".infrared_retrieval",
+    "SendIRCommandBatch": ".infrared_retrieval",
+    "StartIRListener": ".infrared_retrieval",
+    "StopIRListener": ".infrared_retrieval",
+    "ClearIREvents": ".infrared_retrieval",
+    "SubmitMappings": ".infrared_retrieval",
+    "GetListenerStatus": ".infrared_retrieval",
+    "TroubleshootIR": ".infrared_retrieval",
+    "ReadHumiditySensor": ".humidity_sensor",
+    "ReadPhotoSensor": ".photo_sensor",
+    "SendNotification": ".notifications",
+    "ClimateSimulation": ".simulation",
+    "ControlPlug": ".smart_plug",
+}
+
+__all__ = list(_TOOLS)
+
+
+def __getattr__(name):
+    if name not in _TOOLS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool = getattr(import_module(_TOOLS[name], __name__), name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -8,8 +8,6 @@ class ReadHumidityInput(BaseToolInput):
 
     model_config = ConfigDict(json_schema_extra={"examples": [{}]})
 
-    pass
-
 
 class ReadHumidityOutput(BaseToolInput):
     model_config = ConfigDict(
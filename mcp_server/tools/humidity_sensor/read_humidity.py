@@ -1,7 +1,10 @@
+import asyncio
+import atexit
 import logging
 import time
-from datetime import datetime
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Optional
 
 from mcp_server.constants.gpio_pins import GPIO_PIN_17
 from mcp_server.interfaces.tool import Tool, ToolResponse
@@ -11,12 +14,75 @@ from mcp_server.tools.humidity_sensor.humidity_models import (
 )
 from mcp_server.utils.simulated_environment import SimulatedEnvironment
 
-# these libraries can be problematic outside of raspberry pi device
-import board
-import adafruit_dht
+if TYPE_CHECKING:
+    import adafruit_dht
 
 logger = logging.getLogger(__name__)
 
+# One driver per GPIO pin, kept open between reads
+_DHT_SENSORS: Dict[int, "adafruit_dht.DHT22"] = {}
+_DHT_LOCK = asyncio.Lock()
+# Reads get their own worker so a slow or failing sensor never ties up the
+# default executor shared with other tools
+_DHT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dht")
+
+# The DHT22 cannot produce a new sample faster than every ~2s, so a
+# successful reading is served again to calls inside that window
+_MIN_READ_INTERVAL_S = 2.0
+_last_reading: Optional[ReadHumidityOutput] = None
+_last_read_at = 0.0
+
+# board and adafruit_dht probe the GPIO chip when imported, so they are only
+# loaded the first time a real sensor read is needed; simulation never does
+_board = None
+_adafruit_dht = None
+
+
+def _dht_available() -> bool:
+    """Import the DHT22 libraries on first call and report whether they loaded."""
+    global _board, _adafruit_dht
+    if _adafruit_dht is None:
+        # these libraries can be problematic outside of raspberry pi device
+        try:
+            import board
+            import adafruit_dht
+        except ImportError:
+            return False
+        _board = board
+        _adafruit_dht = adafruit_dht
+    return True
+
+
+def _get_dht(pin: int) -> "adafruit_dht.DHT22":
+    """Return the cached DHT22 driver for a pin, creating it on first use."""
+    dht = _DHT_SENSORS.get(pin)
+    if dht is None:
+        dht = _adafruit_dht.DHT22(getattr(_board, f"D{pin}"), use_pulseio=False)
+        _DHT_SENSORS[pin] = dht
+    return dht
+
+
+def _read_dht(dht: "adafruit_dht.DHT22"):
+    """Read (temperature_c, humidity); bit-bangs the sensor and blocks."""
+    return dht.temperature, dht.humidity
+
+
+def _drop_dht(pin: int) -> None:
+    """Release a pin's cached driver so the next read starts from a fresh one."""
+    dht = _DHT_SENSORS.pop(pin, None)
+    if dht is not None:
+        try:
+            dht.exit()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _close_dht_sensors() -> None:
+    """Release the GPIO lines held by cached DHT22 drivers."""
+    for pin in list(_DHT_SENSORS):
+        _drop_dht(pin)
+
 
 class ReadHumiditySensor(Tool):
     """Tool that reads temperature and humidity from a DHT22 sensor or simulation."""
@@ -30,100 +96,133 @@ class ReadHumiditySensor(Tool):
     input_model = ReadHumidityInput
     output_model = ReadHumidityOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for this tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: ReadHumidityInput) -> ToolResponse:
-        """Execute the read humidity sensor tool."""
+        """Execute the read humidity sensor tool.
+
+        Outputs are built with model_construct: every field comes from the
+        sensor driver or a server-side message, never from the caller.
+        """
+        global _last_reading, _last_read_at
+
         env = SimulatedEnvironment.get_instance()
         if env.is_simulation_enabled():
             success, temp_c, temp_f, humidity, message = env.read_sensor()
 
             if success:
-                timestamp = datetime.utcnow().isoformat()
+                temp_c = round(temp_c, 1)
+                temp_f = round(temp_f, 1)
+                humidity = round(humidity, 1)
+                timestamp = datetime.now(timezone.utc).isoformat()
                 logger.info(
-                    f"Simulated sensor: {temp_c:.1f}°C ({temp_f:.1f}°F), {humidity:.1f}%"
+                    "Simulated sensor: %s°C (%s°F), %s%%",
+                    temp_c,
+                    temp_f,
+                    humidity,
                 )
-                output = ReadHumidityOutput(
+                output = ReadHumidityOutput.model_construct(
                     success=True,
-                    temperature_c=round(temp_c, 1),
-                    temperature_f=round(temp_f, 1),
-                    humidity=round(humidity, 1),
+                    temperature_c=temp_c,
+                    temperature_f=temp_f,
+                    humidity=humidity,
                     timestamp=timestamp,
                     message=message,
                 )
             else:
-                logger.error(f"Simulated sensor failed: {message}")
-                output = ReadHumidityOutput(
+                logger.error("Simulated sensor failed: %s", message)
+                output = ReadHumidityOutput.model_construct(
                     success=False,
                     message=message,
                 )
 
             return ToolResponse.from_model(output)
 
-        logger.info(f"Reading DHT22 sensor on GPIO {GPIO_PIN_17}")
+        if not _dht_available():
+            logger.error("DHT22 libraries (board, adafruit_dht) not available")
+            output = ReadHumidityOutput.model_construct(
+                success=False,
+                message="DHT22 sensor libraries not available - install adafruit-circuitpython-dht on the Raspberry Pi.",
+            )
+            return ToolResponse.from_model(output)
 
-        try:
+        logger.info("Reading DHT22 sensor on GPIO %d", GPIO_PIN_17)
+
+        # One read at a time: concurrent bit-banging of the same pin corrupts
+        # both reads
+        async with _DHT_LOCK:
+            if (
+                _last_reading is not None
+                and time.monotonic() - _last_read_at < _MIN_READ_INTERVAL_S
+            ):
+                logger.debug("Returning DHT22 reading taken within the last 2s")
+                return ToolResponse.from_model(_last_reading)
+
+            output = await self._read_hardware()
+            if output.success:
+                _last_reading = output
+                _last_read_at = time.monotonic()
 
-            board_pin = board.D17
-            dht = adafruit_dht.DHT22(board_pin, use_pulseio=False)
+        return ToolResponse.from_model(output)
+
+    async def _read_hardware(self) -> ReadHumidityOutput:
+        """Read the DHT22, retrying on the sensor's frequent transient failures."""
+        max_retries = 3
+        last_error = None
+        try:
+            dht = _get_dht(GPIO_PIN_17)
+            loop = asyncio.get_running_loop()
 
-            max_retries = 3
             for attempt in range(1, max_retries + 1):
+                if attempt > 1:
+                    await asyncio.sleep(2)
                 try:
-                    temperature_c = dht.temperature
-                    humidity = dht.humidity
-
-                    if temperature_c is not None and humidity is not None:
-                        temperature_f = temperature_c * 9.0 / 5.0 + 32.0
-                        timestamp = datetime.utcnow().isoformat()
-
-                        logger.info(
-                            f"DHT22 read (attempt {attempt}): {temperature_c:.1f}°C ({temperature_f:.1f}°F), {humidity:.1f}%"
-                        )
-                        output = ReadHumidityOutput(
-                            success=True,
-                            temperature_c=round(temperature_c, 1),
-                            temperature_f=round(temperature_f, 1),
-                            humidity=round(humidity, 1),
-                            timestamp=timestamp,
-                            message=f"Successfully read sensor data: {temperature_c:.1f}°C ({temperature_f:.1f}°F), {humidity:.1f}% humidity",
-                        )
-                        break
-                    else:
-                        if attempt < max_retries:
-                            time.sleep(2)
-                        else:
-                            logger.error(
-                                f"Sensor returned None after {max_retries} attempts"
-                            )
-                            output = ReadHumidityOutput(
-                                success=False,
-                                message=f"Sensor read failed after {max_retries} attempts (returned None). Check: 1) Sensor connections, 2) Power supply (3.3V), 3) Try a different DHT22 sensor.",
-                            )
+                    # The read bit-bangs GPIO; keep it off the event loop
+                    temperature_c, humidity = await loop.run_in_executor(
+                        _DHT_EXECUTOR, _read_dht, dht
+                    )
                 except RuntimeError as e:
-                    if attempt < max_retries:
-                        time.sleep(2)
-                    else:
-                        logger.error(f"RuntimeError after {max_retries} attempts: {e}")
-                        output = ReadHumidityOutput(
-                            success=False,
-                            message=f"Sensor read failed after {max_retries} attempts: {str(e)}. DHT sensors are sensitive - try again.",
-                        )
+                    last_error = str(e)
+                    continue
 
-            dht.exit()
+                if temperature_c is None or humidity is None:
+                    last_error = "sensor returned None"
+                    continue
+
+                # Rounded once; str() of a value rounded to one place
+                # prints the same digits as :.1f, so the message reuses
+                # these instead of formatting the raw floats
+                temp_c = round(temperature_c, 1)
+                temp_f = round(temperature_c * 9.0 / 5.0 + 32.0, 1)
+                humidity = round(humidity, 1)
+                timestamp = datetime.now(timezone.utc).isoformat()
+
+                logger.info(
+                    "DHT22 read (attempt %d): %s°C (%s°F), %s%%",
+                    attempt,
+                    temp_c,
+                    temp_f,
+                    humidity,
+                )
+                return ReadHumidityOutput.model_construct(
+                    success=True,
+                    temperature_c=temp_c,
+                    temperature_f=temp_f,
+                    humidity=humidity,
+                    timestamp=timestamp,
+                    message=f"Successfully read sensor data: {temp_c}°C ({temp_f}°F), {humidity}% humidity",
+                )
 
         except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
-            output = ReadHumidityOutput(
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            # The driver may be left holding the line mid-transfer; don't
+            # hand it to the next read
+            _drop_dht(GPIO_PIN_17)
+            return ReadHumidityOutput.model_construct(
                 success=False,
                 message=f"Unexpected error reading sensor: {str(e)}",
             )
 
-        return ToolResponse.from_model(output)
+        logger.error("DHT22 read failed after %d attempts: %s", max_retries, last_error)
+        return ReadHumidityOutput.model_construct(
+            success=False,
+            message=f"Sensor read failed after {max_retries} attempts: {last_error}. DHT sensors are sensitive - check: 1) Sensor connections, 2) Power supply (3.3V), 3) Try a different DHT22 sensor.",
+        )
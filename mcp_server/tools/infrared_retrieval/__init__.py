@@ -4,6 +4,7 @@ from .clear_events import ClearIREvents
 from .submit_mappings import SubmitMappings
 from .listener_status import GetListenerStatus
 from .send_ir_command import SendIRCommand
+from .send_ir_batch import SendIRCommandBatch
 from .troubleshoot import TroubleshootIR
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     "SubmitMappings",
     "GetListenerStatus",
     "SendIRCommand",
+    "SendIRCommandBatch",
     "TroubleshootIR",
 ]
\ No newline at end of file
@@ -1,5 +1,4 @@
 import logging
-from typing import Dict, Any
 
 from mcp_server.interfaces.tool import Tool, ToolResponse
 from mcp_server.services.ir_listener_manager import IRListenerManager
@@ -19,21 +18,12 @@ class ClearIREvents(Tool):
     input_model = ClearIrEventsInput
     output_model = ClearIrEventsOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for this tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: ClearIrEventsInput) -> ToolResponse:
         """Execute the clear IR events tool."""
         manager = IRListenerManager.get_instance()
-        events_before = len(manager.get_recent_events(3600))
+        events_before = manager.count_recent_events(3600)
         manager.clear_events()
-        logger.info(f"Cleared {events_before} IR events")
+        logger.info("Cleared %d IR events", events_before)
 
         output = ClearIrEventsOutput(
             success=True,
@@ -7,8 +7,6 @@ class ClearIrEventsInput(BaseToolInput):
 
     model_config = ConfigDict(json_schema_extra={"examples": [{}]})
 
-    pass
-
 
 class ClearIrEventsOutput(BaseToolInput):
     model_config = ConfigDict(
@@ -1,5 +1,4 @@
 import logging
-from typing import Dict, Any
 
 from mcp_server.interfaces.tool import Tool, ToolResponse
 from mcp_server.services.ir_listener_manager import IRListenerManager
@@ -19,41 +18,37 @@ class GetListenerStatus(Tool):
     input_model = GetListenerStatusInput
     output_model = GetListenerStatusOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for this tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: GetListenerStatusInput) -> ToolResponse:
         """Execute the get listener status tool."""
         manager = IRListenerManager.get_instance()
         status = manager.get_listener_status()
 
-        recent_events_1min = manager.get_recent_events(60)
-        recent_events_5min = manager.get_recent_events(300)
-
-        if status["is_listening"]:
-            if status["total_events"] > 0:
-                status_msg = f"IR listener is ACTIVE and working! Captured {status['total_events']} signals total. Recent activity: {len(recent_events_1min)} signals in last minute, {len(recent_events_5min)} in last 5 minutes."
-            else:
-                status_msg = f"IR listener is running but no signals detected yet. Make sure IR transmitter is working and pointed at GPIO pin {status['gpio_pin']}."
+        total_events = status["total_events"]
+        if not status["is_listening"]:
+            parts = [
+                "IR listener is not currently running. Use StartIRListener to begin capturing signals."
+            ]
+        elif total_events > 0:
+            parts = [
+                f"IR listener is ACTIVE and working! Captured {total_events} signals total.",
+                f"Recent activity: {status['recent_events_1min']} signals in last minute, {status['recent_events_5min']} in last 5 minutes.",
+            ]
         else:
-            status_msg = "IR listener is not currently running. Use StartIRListener to begin capturing signals."
+            parts = [
+                f"IR listener is running but no signals detected yet. Make sure IR transmitter is working and pointed at GPIO pin {status['gpio_pin']}."
+            ]
 
         if "latest_event_time" in status:
-            status_msg += f" Latest signal captured at {status['latest_event_time']}."
+            parts.append(f"Latest signal captured at {status['latest_event_time']}.")
+        status_msg = " ".join(parts)
 
         output = GetListenerStatusOutput(
             success=True,
             is_listening=status["is_listening"],
             gpio_pin=status["gpio_pin"],
-            total_events=status["total_events"],
-            recent_events_1min=len(recent_events_1min),
-            recent_events_5min=len(recent_events_5min),
+            total_events=total_events,
+            recent_events_1min=status["recent_events_1min"],
+            recent_events_5min=status["recent_events_5min"],
             listener_task_active=status["listener_task_active"],
             latest_event_time=status.get("latest_event_time"),
             message=status_msg,
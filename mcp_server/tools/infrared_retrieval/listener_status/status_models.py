@@ -8,8 +8,6 @@ class GetListenerStatusInput(BaseToolInput):
 
     model_config = ConfigDict(json_schema_extra={"examples": [{}]})
 
-    pass
-
 
 class GetListenerStatusOutput(BaseToolInput):
     model_config = ConfigDict(
@@ -0,0 +1,3 @@
+from .send_ir_batch import SendIRCommandBatch
+
+__all__ = ['SendIRCommandBatch']
@@ -0,0 +1,49 @@
+from typing import List
+from pydantic import Field, ConfigDict
+from mcp_server.interfaces.tool import BaseToolInput
+from mcp_server.tools.infrared_retrieval.send_ir_command.command_models import (
+    SendIRCommandRequest,
+    SendIRCommandResponse,
+)
+
+
+class SendIRCommandBatchRequest(BaseToolInput):
+    """Request model for sending several IR commands in one call."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "commands": [
+                        {"device_id": "living_room_fan", "operation": "power_on"},
+                        {"device_id": "living_room_fan", "operation": "speed_up"},
+                    ],
+                    "gap_ms": 500,
+                }
+            ]
+        }
+    )
+
+    commands: List[SendIRCommandRequest] = Field(
+        min_length=1,
+        max_length=32,
+        description="Commands to send, transmitted one after another in this order",
+    )
+
+    gap_ms: int = Field(
+        default=500,
+        ge=0,
+        le=10000,
+        description="Pause between consecutive transmissions so devices register each command",
+        examples=[500],
+    )
+
+
+class SendIRCommandBatchResponse(BaseToolInput):
+    """Response model for a batch of IR commands."""
+
+    success: bool = Field(description="Whether every command was sent successfully")
+    message: str = Field(description="Summary of the batch")
+    results: List[SendIRCommandResponse] = Field(
+        description="Outcome of each command, in request order"
+    )
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import List
+
+from mcp_server.interfaces.tool import Tool, ToolResponse
+from mcp_server.tools.infrared_retrieval.send_ir_batch.batch_models import (
+    SendIRCommandBatchRequest,
+    SendIRCommandBatchResponse,
+)
+from mcp_server.tools.infrared_retrieval.send_ir_command.command_models import (
+    SendIRCommandResult,
+)
+from mcp_server.tools.infrared_retrieval.send_ir_command.send_ir_command import (
+    lookup_error_message,
+    transmit_ir_command,
+)
+from mcp_server.utils.device_registry import get_ir_command
+
+logger = logging.getLogger(__name__)
+
+
+class SendIRCommandBatch(Tool):
+    """Tool that sends a sequence of IR commands in a single call."""
+
+    name = "SendIRCommandBatch"
+    description = "Sends several IR commands to registered devices in one call, in order, with a short pause between transmissions (e.g. power on a fan then raise its speed). Each command is sent exactly like SendIRCommand and reported individually."
+    input_model = SendIRCommandBatchRequest
+    output_model = SendIRCommandBatchResponse
+
+    async def execute(self, input_data: SendIRCommandBatchRequest) -> ToolResponse:
+        """Send each command in turn; one failure doesn't stop the rest."""
+        gap_s = input_data.gap_ms / 1000
+        results: List[SendIRCommandResult] = []
+        sent = 0
+        transmitted = False
+
+        for command in input_data.commands:
+            device_id = command.device_id
+            operation = command.operation
+
+            # Registry lookups are cached, so repeat devices cost nothing
+            ir_command = get_ir_command(device_id, operation)
+            if ir_command is None:
+                results.append(
+                    {
+                        "success": False,
+                        "message": lookup_error_message(device_id, operation),
+                        "device_id": device_id,
+                        "operation": operation,
+                    }
+                )
+                continue
+
+            # There is one IR LED, so commands go out strictly one at a time
+            if transmitted and gap_s:
+                await asyncio.sleep(gap_s)
+            result = await transmit_ir_command(device_id, operation, ir_command)
+            transmitted = True
+
+            if result["success"]:
+                sent += 1
+            results.append(result)
+
+        total = len(results)
+        logger.info("IR batch complete: %d of %d commands sent", sent, total)
+
+        return ToolResponse.from_dict(
+            {
+                "success": sent == total,
+                "message": f"Sent {sent} of {total} IR commands.",
+                "results": results,
+            }
+        )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, TypedDict
 from pydantic import Field, ConfigDict
 from mcp_server.interfaces.tool import BaseToolInput
 
@@ -38,3 +38,17 @@ class SendIRCommandResponse(BaseToolInput):
     operation: Optional[str] = Field(
         default=None, description="The operation that was performed"
     )
+
+
+class SendIRCommandResult(TypedDict):
+    """Payload SendIRCommand returns; mirrors SendIRCommandResponse.
+
+    Responses are built from server-side values only, so the tool fills
+    this plain dict and SendIRCommandResponse is kept for the advertised
+    output schema.
+    """
+
+    success: bool
+    message: str
+    device_id: Optional[str]
+    operation: Optional[str]
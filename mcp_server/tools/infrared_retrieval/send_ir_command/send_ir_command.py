@@ -1,150 +1,170 @@
 import logging
-from typing import Dict, Any
 
 from mcp_server.interfaces.tool import Tool, ToolResponse
 from mcp_server.tools.infrared_retrieval.send_ir_command.command_models import (
     SendIRCommandRequest,
     SendIRCommandResponse,
+    SendIRCommandResult,
 )
 from mcp_server.utils.device_registry import (
+    IRCommand,
+    get_ir_command,
     load_device_mapping,
-    get_device_operation_details,
 )
-from mcp_server.utils.ir_event_controls import ir_send
+from mcp_server.utils.ir_event_controls import ir_send_async
 
 logger = logging.getLogger(__name__)
 
 
-class SendIRCommand(Tool):
-    """Generic tool that sends IR commands to any registered device."""
+def lookup_error_message(device_id: str, operation: str) -> str:
+    """Explain why get_ir_command() could not resolve a device operation."""
+    device_mapping = load_device_mapping(device_id)
 
-    name = "SendIRCommand"
-    description = "Sends an IR command to a registered device using ~78% duty cycle and 5x repeat transmission for strong signal that can actually control devices. Can perform any operation that was mapped during device registration (power_on, power_off, speed_up, etc.)."
-    input_model = SendIRCommandRequest
-    output_model = SendIRCommandResponse
+    if not device_mapping:
+        logger.warning("Device '%s' not found in registry", device_id)
+        return f"Device '{device_id}' not found. Make sure the device is registered using SubmitMappings."
 
-    def get_schema(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
-    def _create_error_response(
-        self, message: str, device_id: str = None, operation: str = None
-    ) -> ToolResponse:
-        output = SendIRCommandResponse(
-            success=False, message=message, device_id=device_id, operation=operation
+    codes = device_mapping.get("codes")
+    if not codes or operation not in codes:
+        available_ops = list(codes) if codes else []
+        logger.warning(
+            "Operation '%s' not available for device '%s'. Available: %s",
+            operation,
+            device_id,
+            available_ops,
         )
-        return ToolResponse.from_model(output)
-
-    async def execute(self, input_data: SendIRCommandRequest) -> ToolResponse:
-        """Execute the IR command sending."""
-        logger.info("=== Sending IR Command ===")
-        logger.info(
-            f"Device: '{input_data.device_id}', Operation: '{input_data.operation}'"
+        return (
+            f"Operation '{operation}' not available for device '{device_id}'. "
+            f"Available operations: {available_ops}"
         )
 
-        device_mapping = load_device_mapping(input_data.device_id)
+    logger.error("Configuration error for device '%s': missing 'protocol'", device_id)
+    return f"Configuration error for device '{device_id}': missing 'protocol'"
 
-        if not device_mapping:
-            logger.warning(f"Device '{input_data.device_id}' not found in registry")
-            return self._create_error_response(
-                f"Device '{input_data.device_id}' not found. Make sure the device is registered using SubmitMappings.",
-                device_id=input_data.device_id,
-                operation=input_data.operation,
-            )
 
-        if (
-            "codes" not in device_mapping
-            or input_data.operation not in device_mapping["codes"]
-        ):
-            available_ops = list(device_mapping.get("codes", {}).keys())
-            logger.warning(
-                f"Operation '{input_data.operation}' not available for device '{input_data.device_id}'. Available: {available_ops}"
-            )
-            return self._create_error_response(
-                f"Operation '{input_data.operation}' not available for device '{input_data.device_id}'. "
-                f"Available operations: {available_ops}",
-                device_id=input_data.device_id,
-                operation=input_data.operation,
-            )
+async def transmit_ir_command(
+    device_id: str, operation: str, ir_command: IRCommand
+) -> SendIRCommandResult:
+    """Send a resolved IR command and describe the outcome.
+
+    Shared by SendIRCommand and SendIRCommandBatch so both report sends
+    the same way.
+    """
+    protocol = ir_command.protocol
+    hex_code = ir_command.hex_code
+    operation_details = ir_command.details
 
-        operation_details = get_device_operation_details(
-            input_data.device_id, input_data.operation
+    raw_timing_data = None
+    if protocol.lower() == "generic" and operation_details:
+        raw_timing_data = operation_details.get("raw_timing_data")
+        logger.debug(
+            "Using raw timing data for Generic protocol: %d pulses",
+            len(raw_timing_data) if raw_timing_data else 0,
         )
 
-        try:
-            protocol = device_mapping["protocol"]
-            hex_code = device_mapping["codes"][input_data.operation]
-
-            logger.info("IR Command Details:")
-            logger.info(f"  Protocol: {protocol}")
-            logger.info(f"  IR Code: {hex_code}")
-
-            if operation_details:
-                address = operation_details.get("address")
-                command = operation_details.get("command")
-                verified = operation_details.get("verified", False)
-                pulse_count = operation_details.get("pulse_count", 0)
-
-                if address is not None and command is not None:
-                    logger.info(f"  Address: 0x{address:02X}, Command: 0x{command:02X}")
-
-                if verified:
-                    logger.info(f"  Verified {protocol} protocol from capture")
-                else:
-                    logger.info(
-                        "  WARNING: Unverified protocol - using pattern matching"
-                    )
-
-                logger.info(f"  Signal characteristics: {pulse_count} pulses captured")
-                logger.debug(f"  Full operation details: {operation_details}")
-            else:
-                logger.warning(
-                    "  No detailed analysis available - using basic code only"
-                )
-
-        except KeyError as e:
-            logger.error(
-                f"Configuration error for device '{input_data.device_id}': missing {e}"
-            )
-            return self._create_error_response(
-                f"Configuration error for device '{input_data.device_id}': missing {e}",
-                device_id=input_data.device_id,
-                operation=input_data.operation,
-            )
+    ok, detail = await ir_send_async(
+        protocol, hex_code, raw_timing_data=raw_timing_data
+    )
 
+    if ok:
+        if operation_details and operation_details.get("verified"):
+            message = f"Verified {protocol} command '{operation}' sent successfully to '{device_id}' (Code: {hex_code})"
+        else:
+            message = f"Command '{operation}' sent to '{device_id}' using {protocol} protocol (Code: {hex_code})"
+        # The one INFO record per command
         logger.info(
-            "Transmitting IR signal via GPIO17 at 38kHz with ~78% duty cycle (5x repeats for device control)..."
+            "IR command sent: Device=%s Operation=%s Protocol=%s Code=%s",
+            device_id,
+            operation,
+            protocol,
+            hex_code,
         )
+    else:
+        message = f"IR transmission failed for '{operation}' on '{device_id}': {detail}"
+        logger.error("IR transmission failed: %s", message)
 
-        raw_timing_data = None
-        if protocol.lower() == "generic" and operation_details:
-            raw_timing_data = operation_details.get("raw_timing_data")
-            logger.info(
-                f"Using raw timing data for Generic protocol: {len(raw_timing_data) if raw_timing_data else 0} pulses"
-            )
+    return {
+        "success": ok,
+        "message": message,
+        "device_id": device_id,
+        "operation": operation,
+    }
 
-        ok, detail = ir_send(protocol, hex_code, raw_timing_data=raw_timing_data)
 
-        if ok:
-            if operation_details and operation_details.get("verified"):
-                message = f"Verified {protocol} command '{input_data.operation}' sent successfully to '{input_data.device_id}' (Code: {hex_code})"
-            else:
-                message = f"Command '{input_data.operation}' sent to '{input_data.device_id}' using {protocol} protocol (Code: {hex_code})"
-            logger.info(f"IR transmission successful: {detail}")
-        else:
-            message = f"IR transmission failed for '{input_data.operation}' on '{input_data.device_id}': {detail}"
-            logger.error(f"IR transmission failed: {message}")
+class SendIRCommand(Tool):
+    """Generic tool that sends IR commands to any registered device."""
 
-        logger.info("=== IR Command Complete ===")
+    name = "SendIRCommand"
+    description = "Sends an IR command to a registered device using ~78% duty cycle and 5x repeat transmission for strong signal that can actually control devices. Can perform any operation that was mapped during device registration (power_on, power_off, speed_up, etc.)."
+    input_model = SendIRCommandRequest
+    output_model = SendIRCommandResponse
 
-        output = SendIRCommandResponse(
-            success=ok,
-            message=message,
+    def _create_error_response(
+        self, message: str, device_id: str = None, operation: str = None
+    ) -> ToolResponse:
+        result: SendIRCommandResult = {
+            "success": False,
+            "message": message,
+            "device_id": device_id,
+            "operation": operation,
+        }
+        return ToolResponse.from_dict(result)
+
+    def _lookup_error_response(self, input_data: SendIRCommandRequest) -> ToolResponse:
+        """Explain why a device operation could not be resolved."""
+        return self._create_error_response(
+            lookup_error_message(input_data.device_id, input_data.operation),
             device_id=input_data.device_id,
             operation=input_data.operation,
         )
-        return ToolResponse.from_model(output)
+
+    async def execute(self, input_data: SendIRCommandRequest) -> ToolResponse:
+        """Execute the IR command sending."""
+        logger.debug(
+            "Sending IR command: Device=%s Operation=%s",
+            input_data.device_id,
+            input_data.operation,
+        )
+
+        ir_command = get_ir_command(input_data.device_id, input_data.operation)
+        if ir_command is None:
+            return self._lookup_error_response(input_data)
+
+        protocol = ir_command.protocol
+        hex_code = ir_command.hex_code
+        operation_details = ir_command.details
+
+        if not operation_details:
+            logger.warning("No detailed analysis available - using basic code only")
+
+        # Per-command detail is for debugging only, so it is collected into
+        # one record (fields also attached as extra["ir_cmd"]) only when
+        # DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            details = operation_details or {}
+            ir_cmd = {
+                "device_id": input_data.device_id,
+                "operation": input_data.operation,
+                "protocol": protocol,
+                "hex_code": hex_code,
+                "address": details.get("address"),
+                "command": details.get("command"),
+                "verified": bool(details.get("verified", False)),
+                "pulse_count": details.get("pulse_count", 0),
+            }
+            logger.debug(
+                "IR command details: Protocol=%s Code=%s Address=%s Command=%s "
+                "Verified=%s Pulses=%d",
+                protocol,
+                hex_code,
+                ir_cmd["address"],
+                ir_cmd["command"],
+                ir_cmd["verified"],
+                ir_cmd["pulse_count"],
+                extra={"ir_cmd": ir_cmd},
+            )
+
+        result = await transmit_ir_command(
+            input_data.device_id, input_data.operation, ir_command
+        )
+        return ToolResponse.from_dict(result)
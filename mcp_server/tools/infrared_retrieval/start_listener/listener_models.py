@@ -7,8 +7,6 @@ class StartIrListenerInput(BaseToolInput):
 
     model_config = ConfigDict(json_schema_extra={"examples": [{}]})
 
-    pass
-
 
 class StartIrListenerOutput(BaseToolInput):
     model_config = ConfigDict(
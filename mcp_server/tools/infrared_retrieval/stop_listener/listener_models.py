@@ -7,8 +7,6 @@ class StopIrListenerInput(BaseToolInput):
 
     model_config = ConfigDict(json_schema_extra={"examples": [{}]})
 
-    pass
-
 
 class StopIrListenerOutput(BaseToolInput):
     model_config = ConfigDict(
@@ -1,5 +1,4 @@
 import logging
-from typing import Dict, Any
 
 from mcp_server.interfaces.tool import Tool, ToolResponse
 from mcp_server.services.ir_listener_manager import IRListenerManager
@@ -21,15 +20,6 @@ class StopIRListener(Tool):
     input_model = StopIrListenerInput
     output_model = StopIrListenerOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for this tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: StopIrListenerInput) -> ToolResponse:
         """Execute the stop IR listener tool."""
         manager = IRListenerManager.get_instance()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import ConfigDict, Field
 from mcp_server.interfaces.tool import BaseToolInput
 
@@ -63,13 +63,13 @@ class SubmitMappingsOutput(BaseToolInput):
         description="Device profile that was updated.",
         examples=["levoit_core300s"],
     )
-    mapped_required: List[str] = Field(
-        default_factory=list,
+    mapped_required: Tuple[str, ...] = Field(
+        (),
         description="Required operations that were successfully bound.",
         examples=[["power_on", "power_off"]],
     )
-    mapped_optional: List[str] = Field(
-        default_factory=list,
+    mapped_optional: Tuple[str, ...] = Field(
+        (),
         description="Optional operations that were successfully bound.",
         examples=[["speed_up", "speed_down", "timer"]],
     )
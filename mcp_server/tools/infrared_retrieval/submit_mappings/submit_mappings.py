@@ -1,5 +1,4 @@
 import logging
-from typing import Dict, Any
 
 from mcp_server.interfaces.tool import Tool, ToolResponse
 from mcp_server.services.ir_listener_manager import IRListenerManager
@@ -11,6 +10,9 @@ from mcp_server.utils.device_registry import save_device_mapping
 
 logger = logging.getLogger(__name__)
 
+# Operations every device mapping has to include
+_REQUIRED_OPS = frozenset(("power_on", "power_off"))
+
 
 class SubmitMappings(Tool):
     """Tool that submits IR mappings for a single device."""
@@ -28,15 +30,6 @@ class SubmitMappings(Tool):
     input_model = SubmitMappingsInput
     output_model = SubmitMappingsOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for this tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: SubmitMappingsInput) -> ToolResponse:
         """Execute the submit mappings tool."""
         logger.info(
@@ -45,10 +38,7 @@ class SubmitMappings(Tool):
 
         manager = IRListenerManager.get_instance()
 
-        if (
-            "power_on" not in input_data.required_operations
-            or "power_off" not in input_data.required_operations
-        ):
+        if not _REQUIRED_OPS.issubset(input_data.required_operations):
             logger.warning(
                 f"Missing required operations: {input_data.required_operations}"
             )
@@ -56,8 +46,6 @@ class SubmitMappings(Tool):
                 success=False,
                 message="Required operations must include both 'power_on' and 'power_off'.",
                 device_key=input_data.device_key,
-                mapped_required=[],
-                mapped_optional=[],
             )
             return ToolResponse.from_model(output)
 
@@ -75,8 +63,6 @@ class SubmitMappings(Tool):
                 message=f"Not enough IR events captured. Expected {num_operations} but found {num_events}. "
                 f"Make sure to press the remote buttons for all operations before submitting mappings.",
                 device_key=input_data.device_key,
-                mapped_required=[],
-                mapped_optional=[],
             )
         elif num_events > num_operations:
             logger.error(f"Too many events: {num_events} > {num_operations}")
@@ -85,8 +71,6 @@ class SubmitMappings(Tool):
                 message=f"Too many IR events captured. Expected {num_operations} but found {num_events}. "
                 f"Use ClearIREvents to clear previous events and try again.",
                 device_key=input_data.device_key,
-                mapped_required=[],
-                mapped_optional=[],
             )
         else:
             relevant_events = recent_events[-num_operations:]
@@ -119,8 +103,8 @@ class SubmitMappings(Tool):
                     message=f"Successfully mapped {num_operations} operations for device '{input_data.device_key}': "
                     f"{num_required} required, {num_optional} optional. Device configuration saved to Raspberry Pi.",
                     device_key=input_data.device_key,
-                    mapped_required=input_data.required_operations,
-                    mapped_optional=input_data.optional_operations,
+                    mapped_required=tuple(input_data.required_operations),
+                    mapped_optional=tuple(input_data.optional_operations),
                 )
             else:
                 logger.error(f"Failed to save mapping for '{input_data.device_key}'")
@@ -129,8 +113,6 @@ class SubmitMappings(Tool):
                     message=f"Failed to save device mapping for '{input_data.device_key}'. "
                     f"Check Raspberry Pi file system permissions.",
                     device_key=input_data.device_key,
-                    mapped_required=[],
-                    mapped_optional=[],
                 )
 
         return ToolResponse.from_model(output)
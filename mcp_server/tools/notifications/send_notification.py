@@ -1,5 +1,4 @@
 import logging
-from typing import Dict, Any
 
 import requests
 
@@ -20,15 +19,6 @@ class SendNotification(Tool):
     input_model = SendNotificationInput
     output_model = SendNotificationOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for this tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: SendNotificationInput) -> ToolResponse:
         """Execute the send notification tool."""
         logger.info("Sending notification to ntfy.sh")
@@ -8,8 +8,6 @@ class ReadPhotoSensorInput(BaseToolInput):
 
     model_config = ConfigDict(json_schema_extra={"examples": [{}]})
 
-    pass
-
 
 class ReadPhotoSensorOutput(BaseToolInput):
     model_config = ConfigDict(
@@ -1,6 +1,7 @@
+import atexit
 import logging
-from datetime import datetime
-from typing import Dict, Any
+import threading
+from datetime import datetime, timezone
 
 from mcp_server.constants.gpio_pins import GPIO_PIN_27
 from mcp_server.interfaces.tool import Tool, ToolResponse
@@ -14,6 +15,59 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# The chip and line request are opened on the first read and kept, so later
+# reads are a single get_value instead of an open/request/release cycle
+_chip = None
+_line_request = None
+_LINE_LOCK = threading.Lock()
+
+
+def _get_line_request():
+    """Return the cached input request for the sensor pin, creating it on first use."""
+    global _chip, _line_request
+
+    if _line_request is None:
+        gpiochip_paths = ["/dev/gpiochip0", "/dev/gpiochip1", "/dev/gpiochip2"]
+        available_chips = [path for path in gpiochip_paths if os.path.exists(path)]
+
+        if not available_chips:
+            logger.error("No GPIO chips found")
+            raise FileNotFoundError(
+                "No GPIO chip devices found. Container may not have --device /dev/gpiochip0 mapped. "
+                "Available /dev devices: " + ", ".join(os.listdir("/dev"))
+            )
+
+        chip = gpiod.Chip(available_chips[0])
+        try:
+            line_settings = gpiod.LineSettings(direction=gpiod.line.Direction.INPUT)
+            _line_request = chip.request_lines(
+                config={GPIO_PIN_27: line_settings}, consumer="photo_sensor"
+            )
+        except Exception:
+            chip.close()
+            raise
+        _chip = chip
+    return _line_request
+
+
+@atexit.register
+def _drop_line_request() -> None:
+    """Release the cached line request and chip so the next read reopens them."""
+    global _chip, _line_request
+
+    if _line_request is not None:
+        try:
+            _line_request.release()
+        except Exception:
+            pass
+    if _chip is not None:
+        try:
+            _chip.close()
+        except Exception:
+            pass
+    _chip = None
+    _line_request = None
+
 
 class ReadPhotoSensor(Tool):
     """Tool that reads light level from a photo sensor (LM393 + photoresistor)."""
@@ -25,62 +79,33 @@ class ReadPhotoSensor(Tool):
     input_model = ReadPhotoSensorInput
     output_model = ReadPhotoSensorOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for this tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: ReadPhotoSensorInput) -> ToolResponse:
         """Execute the read photo sensor tool."""
         logger.info(f"Reading photo sensor on GPIO {GPIO_PIN_27}")
 
         try:
+            with _LINE_LOCK:
+                try:
+                    sensor_state = _get_line_request().get_value(GPIO_PIN_27)
+                except Exception:
+                    _drop_line_request()
+                    raise
+            is_bright = not bool(sensor_state)
 
-            gpiochip_paths = ["/dev/gpiochip0", "/dev/gpiochip1", "/dev/gpiochip2"]
-            available_chips = [path for path in gpiochip_paths if os.path.exists(path)]
-
-            if not available_chips:
-                logger.error("No GPIO chips found")
-                raise FileNotFoundError(
-                    "No GPIO chip devices found. Container may not have --device /dev/gpiochip0 mapped. "
-                    "Available /dev devices: " + ", ".join(os.listdir("/dev"))
-                )
-
-            chip_path = available_chips[0]
-
-            chip = gpiod.Chip(chip_path)
-
-            try:
-                line_settings = gpiod.LineSettings(direction=gpiod.line.Direction.INPUT)
-                line_request = chip.request_lines(
-                    config={GPIO_PIN_27: line_settings}, consumer="photo_sensor"
-                )
-
-                sensor_state = line_request.get_value(GPIO_PIN_27)
-                is_bright = not bool(sensor_state)
-
-                timestamp = datetime.utcnow().isoformat()
-
-                light_level = "Bright" if is_bright else "Dark"
-                logger.info(f"Photo sensor: {light_level}")
-
-                output = ReadPhotoSensorOutput(
-                    success=True,
-                    is_bright=is_bright,
-                    raw_value=sensor_state,
-                    gpio_pin=GPIO_PIN_27,
-                    timestamp=timestamp,
-                    message=f"Light detected: {light_level}",
-                    sensor_info="LM393 digital photo sensor (binary output only)",
-                )
-            finally:
-                if "line_request" in locals():
-                    line_request.release()
-                chip.close()
+            timestamp = datetime.now(timezone.utc).isoformat()
+
+            light_level = "Bright" if is_bright else "Dark"
+            logger.info(f"Photo sensor: {light_level}")
+
+            output = ReadPhotoSensorOutput(
+                success=True,
+                is_bright=is_bright,
+                raw_value=sensor_state,
+                gpio_pin=GPIO_PIN_27,
+                timestamp=timestamp,
+                message=f"Light detected: {light_level}",
+                sensor_info="LM393 digital photo sensor (binary output only)",
+            )
 
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
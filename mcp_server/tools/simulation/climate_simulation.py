@@ -1,5 +1,5 @@
+import asyncio
 import logging
-from typing import Dict, Any
 
 from mcp_server.interfaces.tool import Tool, ToolResponse
 from mcp_server.tools.simulation.climate_models import (
@@ -7,11 +7,16 @@ from mcp_server.tools.simulation.climate_models import (
     ClimateSimulationOutput,
 )
 from mcp_server.utils.simulated_environment import SimulatedEnvironment
-from mcp_server.utils.smart_plug import turn_on, turn_off
+from mcp_server.utils.smart_plug import get_default_plug_ip, turn_on, turn_off
 
 logger = logging.getLogger(__name__)
 
 
+async def _plug_ip() -> str:
+    """Resolve the plug address; first-use discovery blocks, so it runs off the loop."""
+    return await asyncio.to_thread(get_default_plug_ip)
+
+
 class ClimateSimulation(Tool):
     """Unified tool for controlling climate simulation and simulated AC."""
 
@@ -28,14 +33,6 @@ class ClimateSimulation(Tool):
     input_model = ClimateSimulationInput
     output_model = ClimateSimulationOutput
 
-    def get_schema(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: ClimateSimulationInput) -> ToolResponse:
         logger.info(f"Climate simulation action: {input_data.action}")
 
@@ -114,7 +111,7 @@ class ClimateSimulation(Tool):
                     )
 
                 if temp_f <= input_data.target_temp_f:
-                    turn_off()
+                    turn_off(await _plug_ip())
                     env.set_ac_running(False)
                     logger.info(f"Already at target: {temp_f:.1f}°F ≤ {input_data.target_temp_f}°F - AC/plug turned off")
                     output = ClimateSimulationOutput(
@@ -125,7 +122,7 @@ class ClimateSimulation(Tool):
                         target_temp=input_data.target_temp_f,
                     )
                 else:
-                    turn_on()
+                    turn_on(await _plug_ip())
                     env.set_ac_running(True)
                     env.set_target_temperature(input_data.target_temp_f)
                     logger.info(f"AC cooling started at {temp_f:.1f}°F (target: {input_data.target_temp_f}°F) - AC/plug turned on")
@@ -149,7 +146,7 @@ class ClimateSimulation(Tool):
                     ac_running = status["ac_running"]
 
                     if ac_running and target_temp is not None and status["temp_f"] <= target_temp:
-                        turn_off()
+                        turn_off(await _plug_ip())
                         env.set_ac_running(False)
                         logger.info(f"Status check: Target {target_temp}°F reached at {status['temp_f']}°F - AC/plug turned off")
                         output = ClimateSimulationOutput(
@@ -1,5 +1,5 @@
+import asyncio
 import logging
-from typing import Dict, Any
 
 from mcp_server.interfaces.tool import Tool, ToolResponse
 from mcp_server.tools.smart_plug.plug_models import (
@@ -7,7 +7,7 @@ from mcp_server.tools.smart_plug.plug_models import (
     ControlPlugResponse,
 )
 from mcp_server.utils.smart_plug import (
-    PLUG_IP,
+    get_default_plug_ip,
     turn_on,
     turn_off,
     toggle_plug,
@@ -25,17 +25,11 @@ class ControlPlug(Tool):
     input_model = ControlPlugRequest
     output_model = ControlPlugResponse
 
-    def get_schema(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input": self.input_model.model_json_schema(),
-            "output": self.output_model.model_json_schema(),
-        }
-
     async def execute(self, input_data: ControlPlugRequest) -> ToolResponse:
-        ip = input_data.ip or PLUG_IP
-        action = input_data.action.lower()
+        # Discovery blocks for several seconds on first use, so it runs off
+        # the event loop
+        ip = input_data.ip or await asyncio.to_thread(get_default_plug_ip)
+        action = input_data.action
 
         logger.info(f"Controlling plug at {ip}: {action}")
 
@@ -55,7 +49,7 @@ class ControlPlug(Tool):
                 message = "Toggled successfully" if success else "Failed to toggle"
                 _, is_on = get_ac_state(ip) if success else (False, None)
 
-            elif action == "status":
+            else:  # status
                 success, is_on = get_ac_state(ip)
                 if success:
                     state = "on" if is_on else "off"
@@ -63,11 +57,6 @@ class ControlPlug(Tool):
                 else:
                     message = "Failed to get status"
 
-            else:
-                success = False
-                is_on = None
-                message = f"Invalid action '{action}'. Use 'on', 'off', 'toggle', or 'status'"
-
             output = ControlPlugResponse(
                 success=success,
                 message=message,
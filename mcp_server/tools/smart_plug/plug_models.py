@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_validator
 
 
 class ControlPlugRequest(BaseModel):
-    action: str = Field(
+    action: Literal["on", "off", "toggle", "status"] = Field(
         ...,
         description="Action to perform: 'on', 'off', 'toggle', or 'status'",
     )
@@ -11,6 +13,12 @@ class ControlPlugRequest(BaseModel):
         description="Optional: IP address of the smart plug. If not provided, uses auto-discovery.",
     )
 
+    @field_validator("action", mode="before")
+    @classmethod
+    def _normalize_action(cls, value):
+        # Accept 'ON', 'Toggle', etc. as before the action became a Literal
+        return value.lower() if isinstance(value, str) else value
+
 
 class ControlPlugResponse(BaseModel):
     success: bool = Field(..., description="Whether the operation was successful")
@@ -1,5 +1,7 @@
 import json
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -7,27 +9,62 @@ from pathlib import Path
 CONFIG_DIR = Path("/home/pi/.raspberry-mcp")
 DEVICES_FILE = CONFIG_DIR / "devices.json"
 
+# Parsed devices file with the (mtime_ns, size) it was read at; reused until
+# the file changes on disk, so hand edits are picked up without a restart
+_devices_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class IRCommand:
+    """Everything needed to transmit one mapped device operation."""
+
+    protocol: str
+    hex_code: str
+    details: Optional[Dict[str, Any]]
+
 
 def _ensure_config_dir():
     """Ensure the config directory exists."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _devices_stamp() -> Optional[Tuple[int, int]]:
+    """Return the devices file's (mtime_ns, size), or None if it is missing."""
+    try:
+        st = DEVICES_FILE.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _load_devices() -> Dict[str, Any]:
     """Load all devices from storage.
 
+    The parsed file is shared between calls while it is unchanged on disk;
+    callers must not mutate the returned dictionary.
+
     Returns:
         Dictionary of all device mappings
     """
-    if not DEVICES_FILE.exists():
+    global _devices_cache
+
+    stamp = _devices_stamp()
+    if stamp is None:
         return {}
 
+    cached = _devices_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     try:
         with open(DEVICES_FILE, "r") as f:
-            return json.load(f)
+            devices = json.load(f)
     except (json.JSONDecodeError, FileNotFoundError):
         return {}
 
+    _devices_cache = (stamp, devices)
+    return devices
+
 
 def save_device_mapping(
     device_key: str,
@@ -49,8 +86,9 @@ def save_device_mapping(
     try:
         _ensure_config_dir()
 
-        # Load existing devices or create new structure
-        devices = _load_devices()
+        # Load existing devices or create new structure; copied so a failed
+        # write leaves the cached registry untouched
+        devices = dict(_load_devices())
 
         # Combine operations in order (required first, then optional)
         all_operations = required_operations + optional_operations
@@ -117,6 +155,7 @@ def save_device_mapping(
         with open(DEVICES_FILE, "w") as f:
             json.dump(devices, f, indent=2)
 
+        clear_device_cache()
         return True
 
     except Exception as e:
@@ -124,9 +163,20 @@ def save_device_mapping(
         return False
 
 
+def clear_device_cache() -> None:
+    """Drop cached device mappings so the next lookup re-reads storage."""
+    global _devices_cache
+
+    _devices_cache = None
+    _resolve_ir_command.cache_clear()
+
+
 def load_device_mapping(device_key: str) -> Dict[str, Any] | None:
     """Load a specific device mapping.
 
+    Served from the parsed devices file, which is only re-read when its
+    mtime or size changes; the returned mapping must not be mutated.
+
     Args:
         device_key: Device identifier to load
 
@@ -141,6 +191,40 @@ def load_device_mapping(device_key: str) -> Dict[str, Any] | None:
         return {}
 
 
+def get_ir_command(device_key: str, operation: str) -> IRCommand | None:
+    """Resolve a device operation to its protocol, code and capture details.
+
+    Args:
+        device_key: Device identifier
+        operation: Operation name (e.g., 'power_on', 'volume_up')
+
+    Returns:
+        IRCommand, or None if the device, operation or protocol is missing
+    """
+    # Keyed on the file stamp so resolutions made against an older version
+    # of the file are simply never hit again
+    return _resolve_ir_command(device_key, operation, _devices_stamp())
+
+
+@lru_cache(maxsize=256)
+def _resolve_ir_command(
+    device_key: str, operation: str, stamp: Optional[Tuple[int, int]]
+) -> IRCommand | None:
+    device = load_device_mapping(device_key)
+    if not device:
+        return None
+
+    hex_code = device.get("codes", {}).get(operation)
+    if hex_code is None or "protocol" not in device:
+        return None
+
+    return IRCommand(
+        protocol=device["protocol"],
+        hex_code=hex_code,
+        details=device.get(f"{operation}_details"),
+    )
+
+
 def get_device_operation_details(
     device_key: str, operation: str
 ) -> Dict[str, Any] | None:
@@ -210,11 +294,12 @@ def delete_device(device_key: str) -> bool:
     """
     try:
         _ensure_config_dir()
-        devices = _load_devices()
+        devices = dict(_load_devices())
         if device_key in devices:
             del devices[device_key]
             with open(DEVICES_FILE, "w") as f:
                 json.dump(devices, f, indent=2)
+            clear_device_cache()
             return True
         return False
     except Exception as e:
@@ -1,5 +1,10 @@
+import asyncio
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Tuple
 
 try:
     import pigpio
@@ -22,7 +27,9 @@ def _send_raw_timing_sync(pi, tx_pin: int, duty_cycle: int, timing_data: list) -
             if duration_us <= 0:
                 continue
 
-            if state == "low" or state == "mark":
+            # Captured levels are pigpio ints (0 = mark on the active-low
+            # receiver); older mappings may carry string labels
+            if state == 0 or state == "low" or state == "mark":
                 pi.set_PWM_dutycycle(tx_pin, duty_cycle)
             else:
                 pi.set_PWM_dutycycle(tx_pin, 0)
@@ -38,47 +45,148 @@ def _send_raw_timing_sync(pi, tx_pin: int, duty_cycle: int, timing_data: list) -
         return False
 
 
-def _send_nec_sync(pi, tx_pin: int, duty_cycle: int, hex_code: str) -> bool:
-    """Send NEC protocol IR command - SYNCHRONOUS."""
-    import logging
+# Protocol timings in microseconds
+NEC_HEADER_MARK = 9000
+NEC_HEADER_SPACE = 4500
+NEC_BIT_MARK = 560
+NEC_ONE_SPACE = 1690
+NEC_ZERO_SPACE = 560
+NEC_STOP_BIT = 560
+
+SONY_HEADER_MARK = 2400
+SONY_BIT_MARK = 600
+SONY_ONE_SPACE = 1200
+SONY_ZERO_SPACE = 600
+
+
+@lru_cache(maxsize=512)
+def _nec_waveform(hex_code: str) -> Tuple[float, ...]:
+    """Mark/space durations in seconds for a 32-bit NEC frame, marks first."""
+    code = int(hex_code, 16)
+    durations = [NEC_HEADER_MARK, NEC_HEADER_SPACE]
+    for i in range(32):
+        bit = (code >> (31 - i)) & 1
+        durations.append(NEC_BIT_MARK)
+        durations.append(NEC_ONE_SPACE if bit else NEC_ZERO_SPACE)
+    durations.append(NEC_STOP_BIT)
+    return tuple(us / 1_000_000 for us in durations)
+
+
+@lru_cache(maxsize=512)
+def _sony_waveform(hex_code: str) -> Tuple[float, ...]:
+    """Mark/space durations in seconds for a 12-bit Sony frame, marks first."""
+    code = int(hex_code, 16)
+    durations = [SONY_HEADER_MARK, SONY_ONE_SPACE]
+    for i in range(12):
+        bit = (code >> i) & 1
+        durations.append(SONY_BIT_MARK)
+        durations.append(SONY_ONE_SPACE if bit else SONY_ZERO_SPACE)
+    return tuple(us / 1_000_000 for us in durations)
+
+
+def _play_waveform(
+    pi, tx_pin: int, duty_cycle: int, waveform: Tuple[float, ...]
+) -> None:
+    """Drive the LED through alternating mark/space durations, then turn it off."""
+    marking = True
+    for duration_s in waveform:
+        pi.set_PWM_dutycycle(tx_pin, duty_cycle if marking else 0)
+        time.sleep(duration_s)
+        marking = not marking
+    pi.set_PWM_dutycycle(tx_pin, 0)
+
+
+@lru_cache(maxsize=64)
+def _carrier_pulses(
+    waveform: Tuple[float, ...], tx_pin: int, carrier_freq: int, duty_cycle: int
+) -> tuple:
+    """Expand a mark/space waveform into pigpio pulses with the carrier built in.
+
+    Marks become on/off carrier cycles at duty_cycle/255 (a full 255 keeps
+    the LED on, matching the PWM path). Edges are placed against the ideal
+    timeline so per-cycle rounding doesn't accumulate over a frame.
+    """
+    mask = 1 << tx_pin
+    period_us = 1_000_000 / carrier_freq
+    on_us = period_us * duty_cycle / 255
+    pulses = []
+    start_us = 0.0
+    emitted_us = 0
+    marking = True
+
+    for duration_s in waveform:
+        duration_us = duration_s * 1_000_000
+        if marking and duty_cycle < 255:
+            for cycle in range(max(1, round(duration_us / period_us))):
+                cycle_us = start_us + cycle * period_us
+                on_end = round(cycle_us + on_us)
+                off_end = round(cycle_us + period_us)
+                pulses.append(pigpio.pulse(mask, 0, on_end - emitted_us))
+                pulses.append(pigpio.pulse(0, mask, off_end - on_end))
+                emitted_us = off_end
+        else:
+            end_us = round(start_us + duration_us)
+            if marking:
+                pulses.append(pigpio.pulse(mask, 0, end_us - emitted_us))
+            else:
+                pulses.append(pigpio.pulse(0, mask, end_us - emitted_us))
+            emitted_us = end_us
+        start_us += duration_us
+        marking = not marking
 
-    logger = logging.getLogger(__name__)
+    # Always finish with the LED off
+    pulses.append(pigpio.pulse(0, mask, 0))
+    return tuple(pulses)
 
-    try:
-        if hex_code.startswith("0x"):
-            code = int(hex_code, 16)
-        else:
-            code = int(hex_code, 16)
 
-        logger.info(f"Sending NEC code: 0x{code:08X}")
+def _send_wave(pi, pulses: tuple) -> bool:
+    """Transmit pulses as one DMA-timed pigpio wave and wait for it to finish.
 
-        HEADER_MARK = 9000
-        HEADER_SPACE = 4500
-        BIT_MARK = 560
-        ONE_SPACE = 1690
-        ZERO_SPACE = 560
-        STOP_BIT = 560
+    Returns False, without having transmitted anything, if pigpiod can't
+    build the wave.
+    """
+    try:
+        pi.wave_clear()
+        pi.wave_add_generic(list(pulses))
+        wave_id = pi.wave_create()
+    except Exception:
+        return False
+    if wave_id < 0:
+        return False
 
-        pi.set_PWM_dutycycle(tx_pin, duty_cycle)
-        time.sleep(HEADER_MARK / 1_000_000)
-        pi.set_PWM_dutycycle(tx_pin, 0)
-        time.sleep(HEADER_SPACE / 1_000_000)
+    try:
+        pi.wave_send_once(wave_id)
+        while pi.wave_tx_busy():
+            time.sleep(0.002)
+    finally:
+        pi.wave_delete(wave_id)
+    return True
+
+
+def _transmit(
+    pi, tx_pin: int, duty_cycle: int, carrier_freq: int, waveform: Tuple[float, ...]
+) -> None:
+    """Send a waveform, preferring hardware timing over sleeping between edges."""
+    logger = logging.getLogger(__name__)
+    pulses = _carrier_pulses(waveform, tx_pin, carrier_freq, duty_cycle)
+    if not _send_wave(pi, pulses):
+        logger.debug("pigpio wave unavailable; timing IR edges in Python")
+        _play_waveform(pi, tx_pin, duty_cycle, waveform)
 
-        for i in range(32):
-            bit = (code >> (31 - i)) & 1
 
-            pi.set_PWM_dutycycle(tx_pin, duty_cycle)
-            time.sleep(BIT_MARK / 1_000_000)
+def _send_nec_sync(
+    pi, tx_pin: int, duty_cycle: int, hex_code: str, carrier_freq: int = 38000
+) -> bool:
+    """Send NEC protocol IR command - SYNCHRONOUS."""
+    logger = logging.getLogger(__name__)
 
-            pi.set_PWM_dutycycle(tx_pin, 0)
-            if bit:
-                time.sleep(ONE_SPACE / 1_000_000)
-            else:
-                time.sleep(ZERO_SPACE / 1_000_000)
+    try:
+        # Frames are deterministic per code, so repeat sends reuse the
+        # expanded timings and only the GPIO writes happen per call
+        waveform = _nec_waveform(hex_code)
+        logger.info("Sending NEC code: 0x%08X", int(hex_code, 16))
 
-        pi.set_PWM_dutycycle(tx_pin, duty_cycle)
-        time.sleep(STOP_BIT / 1_000_000)
-        pi.set_PWM_dutycycle(tx_pin, 0)
+        _transmit(pi, tx_pin, duty_cycle, carrier_freq, waveform)
 
         logger.info("NEC transmission completed")
         return True
@@ -88,41 +196,17 @@ def _send_nec_sync(pi, tx_pin: int, duty_cycle: int, hex_code: str) -> bool:
         return False
 
 
-def _send_sony_sync(pi, tx_pin: int, duty_cycle: int, hex_code: str) -> bool:
+def _send_sony_sync(
+    pi, tx_pin: int, duty_cycle: int, hex_code: str, carrier_freq: int = 38000
+) -> bool:
     """Send Sony protocol IR command - SYNCHRONOUS."""
-    import logging
-
     logger = logging.getLogger(__name__)
 
     try:
-        if hex_code.startswith("0x"):
-            code = int(hex_code, 16)
-        else:
-            code = int(hex_code, 16)
-
-        logger.info(f"Sending Sony code: 0x{code:08X}")
-
-        HEADER_MARK = 2400
-        BIT_MARK = 600
-        ONE_SPACE = 1200
-        ZERO_SPACE = 600
-
-        pi.set_PWM_dutycycle(tx_pin, duty_cycle)
-        time.sleep(HEADER_MARK / 1_000_000)
-        pi.set_PWM_dutycycle(tx_pin, 0)
-        time.sleep(ONE_SPACE / 1_000_000)
+        waveform = _sony_waveform(hex_code)
+        logger.info("Sending Sony code: 0x%08X", int(hex_code, 16))
 
-        for i in range(12):
-            bit = (code >> i) & 1
-
-            pi.set_PWM_dutycycle(tx_pin, duty_cycle)
-            time.sleep(BIT_MARK / 1_000_000)
-
-            pi.set_PWM_dutycycle(tx_pin, 0)
-            if bit:
-                time.sleep(ONE_SPACE / 1_000_000)
-            else:
-                time.sleep(ZERO_SPACE / 1_000_000)
+        _transmit(pi, tx_pin, duty_cycle, carrier_freq, waveform)
 
         logger.info("Sony transmission completed")
         return True
@@ -132,6 +216,58 @@ def _send_sony_sync(pi, tx_pin: int, duty_cycle: int, hex_code: str) -> bool:
         return False
 
 
+# pigpiod connection reused across sends; guarded by _tx_lock so only one
+# transmission drives the LED at a time
+_tx_lock = threading.Lock()
+_pi = None
+_pi_carrier_freq = None
+
+# Async callers transmit on this single worker: sends are serialized by the
+# LED anyway, and a long burst never occupies the default executor
+_TX_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ir-tx")
+
+
+def _get_pi():
+    """Return the shared pigpiod connection, reconnecting if it dropped."""
+    global _pi, _pi_carrier_freq
+
+    if _pi is not None and _pi.connected:
+        return _pi
+
+    pi = pigpio.pi()
+    if not pi.connected:
+        return None
+
+    _pi = pi
+    _pi_carrier_freq = None
+    return _pi
+
+
+def _configure_tx(pi, tx_pin: int, carrier_freq: int) -> None:
+    """Set the TX pin up for PWM, skipping work already done on this connection."""
+    global _pi_carrier_freq
+
+    if _pi_carrier_freq != carrier_freq:
+        pi.set_mode(tx_pin, pigpio.OUTPUT)
+        pi.set_PWM_frequency(tx_pin, carrier_freq)
+        _pi_carrier_freq = carrier_freq
+    pi.set_PWM_dutycycle(tx_pin, 0)
+
+
+def _drop_pi(tx_pin: int) -> None:
+    """Turn the LED off if possible and discard the shared connection."""
+    global _pi, _pi_carrier_freq
+
+    if _pi is not None:
+        try:
+            _pi.set_PWM_dutycycle(tx_pin, 0)
+            _pi.stop()
+        except Exception:
+            pass
+    _pi = None
+    _pi_carrier_freq = None
+
+
 def ir_send(
     protocol: str,
     hex_code: str,
@@ -169,65 +305,82 @@ def ir_send(
 
     logger.info(f"IR Send: {protocol} protocol, code {hex_code}")
 
-    pi = None
-    try:
-        pi = pigpio.pi()
-        if not pi.connected:
-            return (
-                False,
-                "pigpiod not running. Start with: sudo systemctl start pigpiod",
-            )
-
-        pi.set_mode(TX_PIN, pigpio.OUTPUT)
-        pi.set_PWM_frequency(TX_PIN, carrier_freq)
-        pi.set_PWM_dutycycle(TX_PIN, 0)
-
-        success = False
-
-        if protocol.lower() == "generic" and raw_timing_data:
-            success = _send_raw_timing_sync(pi, TX_PIN, DUTY_CYCLE, raw_timing_data)
-        elif protocol.lower() == "nec":
-            success = _send_nec_sync(pi, TX_PIN, DUTY_CYCLE, hex_code)
-        elif protocol.lower() == "sony":
-            success = _send_sony_sync(pi, TX_PIN, DUTY_CYCLE, hex_code)
-        else:
-            if raw_timing_data:
-                success = _send_raw_timing_sync(pi, TX_PIN, DUTY_CYCLE, raw_timing_data)
-            else:
-                pi.stop()
+    with _tx_lock:
+        try:
+            pi = _get_pi()
+            if pi is None:
                 return (
                     False,
-                    f"Unsupported protocol '{protocol}' and no raw timing data available",
+                    "pigpiod not running. Start with: sudo systemctl start pigpiod",
                 )
 
-        pi.set_PWM_dutycycle(TX_PIN, 0)
-        pi.stop()
+            _configure_tx(pi, TX_PIN, carrier_freq)
+
+            success = False
 
-        if success:
-            duty_info = "100% power" if power_boost else "78% power"
             if protocol.lower() == "generic" and raw_timing_data:
-                return (
-                    True,
-                    f"Generic IR signal sent ({len(raw_timing_data)} pulses, {duty_info})",
+                success = _send_raw_timing_sync(pi, TX_PIN, DUTY_CYCLE, raw_timing_data)
+            elif protocol.lower() == "nec":
+                success = _send_nec_sync(pi, TX_PIN, DUTY_CYCLE, hex_code, carrier_freq)
+            elif protocol.lower() == "sony":
+                success = _send_sony_sync(
+                    pi, TX_PIN, DUTY_CYCLE, hex_code, carrier_freq
                 )
             else:
-                return True, f"{protocol.upper()} signal {hex_code} sent ({duty_info})"
-        else:
-            return False, f"Failed to send {protocol} signal {hex_code}"
+                if raw_timing_data:
+                    success = _send_raw_timing_sync(
+                        pi, TX_PIN, DUTY_CYCLE, raw_timing_data
+                    )
+                else:
+                    return (
+                        False,
+                        f"Unsupported protocol '{protocol}' and no raw timing data available",
+                    )
+
+            pi.set_PWM_dutycycle(TX_PIN, 0)
+
+            if success:
+                duty_info = "100% power" if power_boost else "78% power"
+                if protocol.lower() == "generic" and raw_timing_data:
+                    return (
+                        True,
+                        f"Generic IR signal sent ({len(raw_timing_data)} pulses, {duty_info})",
+                    )
+                else:
+                    return (
+                        True,
+                        f"{protocol.upper()} signal {hex_code} sent ({duty_info})",
+                    )
+            else:
+                return False, f"Failed to send {protocol} signal {hex_code}"
 
-    except Exception as e:
-        if pi:
-            try:
-                pi.set_PWM_dutycycle(TX_PIN, 0)
-                pi.stop()
-            except Exception:
-                pass
-        return False, f"IR transmission error: {str(e)}"
+        except Exception as e:
+            # The connection may be broken; make the next send reconnect
+            _drop_pi(TX_PIN)
+            return False, f"IR transmission error: {str(e)}"
 
-    except Exception as e:
-        try:
-            if pi is not None:
-                pi.stop()
-        except Exception:
-            pass
-        return False, f"IR send failed: {str(e)}"
+
+async def ir_send_async(
+    protocol: str,
+    hex_code: str,
+    raw_timing_data: list | None = None,
+    power_boost: bool = False,
+    carrier_freq: int = 38000,
+) -> tuple[bool, str]:
+    """Run ir_send on the IR transmit thread without blocking the event loop.
+
+    Takes the same arguments and returns the same (success, message) tuple
+    as ir_send.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _TX_EXECUTOR,
+        partial(
+            ir_send,
+            protocol,
+            hex_code,
+            raw_timing_data=raw_timing_data,
+            power_boost=power_boost,
+            carrier_freq=carrier_freq,
+        ),
+    )
@@ -33,7 +33,9 @@ class SimulatedEnvironment:
         self._ambient_humidity = 55.0
         self._ac_cooling_rate = 0.3  # Degrees F per second
         self._drift_rate = 0.05  # How fast temp returns to ambient per second
-        self._last_update = time.time()
+        # Monotonic, so NTP steps on the Pi can't make the simulated climate
+        # jump or run backwards between updates
+        self._last_update = time.monotonic()
         self._update_thread = None
         self._stop_thread = False
         # AC state tracking
@@ -52,7 +54,7 @@ class SimulatedEnvironment:
             self._current_temp_f = temp_f
             self._current_humidity = humidity
             self._ambient_temp_f = temp_f + 5.0  # Natural drift slightly warmer
-            self._last_update = time.time()
+            self._last_update = time.monotonic()
 
             if self._update_thread is None or not self._update_thread.is_alive():
                 self._stop_thread = False
@@ -115,7 +117,7 @@ class SimulatedEnvironment:
             if not self._simulation_enabled:
                 return
 
-            current_time = time.time()
+            current_time = time.monotonic()
             time_delta = current_time - self._last_update
             self._last_update = current_time
 
@@ -2,6 +2,7 @@ import os
 import requests
 import socket
 import time
+from functools import lru_cache
 from typing import Dict, Optional, List
 from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
 
@@ -34,7 +35,13 @@ def discover_shelly_devices(timeout: int = 3) -> List[Dict[str, str]]:
     return listener.devices
 
 
+@lru_cache(maxsize=1)
 def get_default_plug_ip() -> str:
+    """Resolve the plug address once per process: env var, mDNS, then fallback.
+
+    Discovery blocks for a few seconds, so it runs on the first call that
+    needs an address rather than when the module is imported.
+    """
     env_ip = os.getenv("SMART_PLUG_IP")
     if env_ip:
         return env_ip
@@ -49,12 +56,9 @@ def get_default_plug_ip() -> str:
     return "10.0.0.113"
 
 
-# NOTE setting this globally for script
-PLUG_IP = get_default_plug_ip()
-
-
-def get_plug_info(ip: str = PLUG_IP) -> Optional[Dict]:
+def get_plug_info(ip: Optional[str] = None) -> Optional[Dict]:
     """Get plug device information."""
+    ip = ip or get_default_plug_ip()
     try:
         response = requests.post(
             f"http://{ip}/rpc",
@@ -68,8 +72,9 @@ def get_plug_info(ip: str = PLUG_IP) -> Optional[Dict]:
     return None
 
 
-def get_plug_status(ip: str = PLUG_IP, switch_id: int = 0) -> Optional[Dict]:
+def get_plug_status(ip: Optional[str] = None, switch_id: int = 0) -> Optional[Dict]:
     """Get switch status."""
+    ip = ip or get_default_plug_ip()
     try:
         response = requests.post(
             f"http://{ip}/rpc",
@@ -83,16 +88,17 @@ def get_plug_status(ip: str = PLUG_IP, switch_id: int = 0) -> Optional[Dict]:
     return None
 
 
-def toggle_plug(ip: str = PLUG_IP, switch_id: int = 0) -> bool:
+def toggle_plug(ip: Optional[str] = None, switch_id: int = 0) -> bool:
     """Toggle plug on/off.
 
     Args:
-        ip: Device IP address
+        ip: Device IP address (default: discovered plug)
         switch_id: Switch component ID (default: 0)
 
     Returns:
         True if successful
     """
+    ip = ip or get_default_plug_ip()
     try:
         response = requests.post(
             f"http://{ip}/rpc",
@@ -105,7 +111,7 @@ def toggle_plug(ip: str = PLUG_IP, switch_id: int = 0) -> bool:
 
 
 def set_plug(
-    ip: str = PLUG_IP,
+    ip: Optional[str] = None,
     on: bool = True,
     switch_id: int = 0,
     toggle_after: Optional[int] = None,
@@ -113,7 +119,7 @@ def set_plug(
     """Set plug state.
 
     Args:
-        ip: Device IP address
+        ip: Device IP address (default: discovered plug)
         on: True to turn on, False to turn off
         switch_id: Switch component ID (default: 0)
         toggle_after: Auto-toggle after N seconds (optional)
@@ -121,6 +127,7 @@ def set_plug(
     Returns:
         True if successful
     """
+    ip = ip or get_default_plug_ip()
     try:
         params = {"id": switch_id, "on": on}
         if toggle_after:
@@ -136,21 +143,21 @@ def set_plug(
         return False
 
 
-def turn_on(ip: str = PLUG_IP, switch_id: int = 0) -> bool:
+def turn_on(ip: Optional[str] = None, switch_id: int = 0) -> bool:
     """Turn plug on."""
     return set_plug(ip, True, switch_id)
 
 
-def turn_off(ip: str = PLUG_IP, switch_id: int = 0) -> bool:
+def turn_off(ip: Optional[str] = None, switch_id: int = 0) -> bool:
     """Turn plug off."""
     return set_plug(ip, False, switch_id)
 
 
-def get_ac_state(ip: str = PLUG_IP, switch_id: int = 0) -> tuple[bool, bool]:
+def get_ac_state(ip: Optional[str] = None, switch_id: int = 0) -> tuple[bool, bool]:
     """Get AC (plug) state.
 
     Args:
-        ip: Device IP address
+        ip: Device IP address (default: discovered plug)
         switch_id: Switch component ID (default: 0)
 
     Returns:
@@ -66,7 +66,7 @@ async def run_ir_loopback():
     print("IR TRANSMITTER -> RECEIVER LOOPBACK TEST")
     print("=" * 60 + "\n")
 
-    from mcp_server.utils.ir_event_controls import ir_send
+    from mcp_server.utils.ir_event_controls import ir_send_async
     from mcp_server.services.ir_listener_manager import IRListenerManager
 
     print("TX: GPIO17 (Pin 11)")
@@ -93,7 +93,7 @@ async def run_ir_loopback():
 
     # Send a test IR signal
     print("3. Sending test IR signal...")
-    tx_success, tx_message = await ir_send("nec", "0x12345678")
+    tx_success, tx_message = await ir_send_async("nec", "0x12345678")
 
     if not tx_success:
         print(f"FAILED: Failed to send IR signal: {tx_message}")
@@ -5,7 +5,7 @@ import logging
 # Add the parent directory to Python path
 sys.path.append("/Users/foxj7/Developer_Workspace/raspberry-mcp")
 
-from mcp_server.utils.ir_event_controls import ir_send
+from mcp_server.utils.ir_event_controls import ir_send_async
 from mcp_server.services.ir_listener_manager import IRListenerManager
 
 logging.basicConfig(level=logging.INFO)
@@ -36,7 +36,7 @@ async def test_transmitter_receiver_loopback():
     await asyncio.sleep(1)
 
     print("3. Sending test IR signal...")
-    tx_success, tx_message = await ir_send("nec", "0x12345678")
+    tx_success, tx_message = await ir_send_async("nec", "0x12345678")
 
     if not tx_success:
         print(f"FAILED: Failed to send IR signal: {tx_message}")